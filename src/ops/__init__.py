@@ -10,12 +10,13 @@ from ops.error import (
     TriggerError,
     OtherError,
     op_error_from_json_error,
+    parse_json_or_op_error,
 )
-from ops.contexts import DryContext, WetContext
-from ops.op import Op
+from ops.contexts import CancellationToken, DryContext, WetContext
+from ops.op import Op, static_metadata
 from ops.op_metadata import OpMetadata, TriggerFuse, ValidationReport
 from ops.batch import BatchOp
-from ops.loop_op import LoopOp
+from ops.loop_op import LoopFrame, LoopOp
 from ops.ops import perform, get_caller_trigger_name, wrap_nested_op_exception
 from ops.wrappers.logging_wrapper import LoggingWrapper, create_context_aware_logger, YELLOW, GREEN, RED, RESET
 from ops.wrappers.timeout_wrapper import (
@@ -44,16 +45,20 @@ __all__ = [
     "TriggerError",
     "OtherError",
     "op_error_from_json_error",
+    "parse_json_or_op_error",
     # contexts
+    "CancellationToken",
     "DryContext",
     "WetContext",
     # core
     "Op",
+    "static_metadata",
     "OpMetadata",
     "TriggerFuse",
     "ValidationReport",
     "BatchOp",
     "LoopOp",
+    "LoopFrame",
     # execution
     "perform",
     "get_caller_trigger_name",
@@ -0,0 +1,13 @@
+"""Call-site naming shared by get_caller_trigger_name and the wrapper factories."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def file_stem(filename: str) -> str:
+    """Return the name used before '::lineno' for a code object's co_filename.
+
+    Programs run code from a small fixed set of files, so the string work is
+    done once per file.
+    """
+    return filename.split("/")[-1].replace(".py", "")
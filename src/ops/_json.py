@@ -0,0 +1,77 @@
+"""JSON helpers — stdlib json output; orjson parses when installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to a JSON string.
+
+    Always stdlib json: its output is what checkpoints hold, and orjson
+    differs in ways that must not depend on an optional package (NaN and
+    Infinity become null, separators are compact, dataclasses serialize).
+    """
+    return json.dumps(value)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or bytes.
+
+    orjson parses when installed; documents it rejects but stdlib accepts
+    (NaN/Infinity tokens from dumps, ints wider than 64 bits) are parsed by
+    stdlib, which also raises the error for invalid input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# Scalars are already JSON-shaped; round-tripping them changes nothing.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def to_jsonable(value: Any, default: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Return value as the plain JSON tree json.loads(json.dumps(value)) gives.
+
+    A value that already is such a tree is returned itself, not a copy.
+
+    default converts objects the encoder cannot serialize, as in json.dumps.
+    Raises TypeError or ValueError when value cannot be serialized.
+
+    Anything else goes through the stdlib round-trip: orjson and msgspec
+    turn NaN into null and accept datetime, UUID and Enum values, so
+    validation results would depend on which of them is installed.
+    """
+    if type(value) in _JSON_SCALARS:
+        return value
+    try:
+        if _is_json_tree(value):
+            # Already what a round-trip would produce; skip the encoder
+            return value
+    except RecursionError:
+        pass  # cyclic or very deep; the encoder reports it
+    return json.loads(json.dumps(value, default=default))
+
+
+def _is_json_tree(value: Any) -> bool:
+    """True if value is built only from exact dict (str keys), list and scalars."""
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is list:
+        return all(_is_json_tree(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_json_tree(item) for key, item in value.items()
+        )
+    return False
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Generic, List, TypeVar
+from typing import Any, Dict, Final, Generic, List, Optional, Sequence, TypeVar
 
 from ops.error import AbortedError, BatchFailedError, OpError
 from ops.op import Op
@@ -14,6 +15,14 @@ from ops.batch_metadata import BatchMetadataBuilder
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+_DEFAULT_BATCH_ABORT = "Batch operation aborted"
+
+# The default rollback; ops that do not override it have nothing to undo.
+_NO_ROLLBACK = Op.rollback
+
+# Sentinel for a pure op with no recorded result yet (None is a valid result).
+_MISSING: Final[Any] = object()
+
 
 class BatchOp(Op[List[T]], Generic[T]):
     """Executes a sequence of ops, rolling back all succeeded ops on failure."""
@@ -21,13 +30,16 @@ class BatchOp(Op[List[T]], Generic[T]):
     def __init__(self, ops: List[Op[T]], continue_on_error: bool = False) -> None:
         self._ops: List[Op[T]] = list(ops)
         self._continue_on_error = continue_on_error
+        self._metadata_builder: Optional[BatchMetadataBuilder] = None
 
     def with_continue_on_error(self, continue_on_error: bool) -> "BatchOp[T]":
         self._continue_on_error = continue_on_error
+        self._metadata_builder = None
         return self
 
     def add_op(self, op: Op[T]) -> None:
         self._ops.append(op)
+        self._metadata_builder = None
 
     def len(self) -> int:
         return len(self._ops)
@@ -35,49 +47,141 @@ class BatchOp(Op[List[T]], Generic[T]):
     def is_empty(self) -> bool:
         return len(self._ops) == 0
 
+    def _get_metadata_builder(self) -> BatchMetadataBuilder:
+        # Data flow analysis walks every child's metadata; cache it until the
+        # op list changes.
+        if self._metadata_builder is None:
+            self._metadata_builder = BatchMetadataBuilder(self._ops)
+        return self._metadata_builder
+
     async def _rollback_succeeded_ops(
-        self, succeeded_ops: List[Op[T]], dry: DryContext, wet: WetContext
+        self, succeeded: List[int], dry: DryContext, wet: WetContext
     ) -> None:
-        for op in reversed(succeeded_ops):
-            try:
-                await op.rollback(dry, wet)
-                logger.debug("Successfully rolled back op %s", op.metadata().name)
-            except Exception as e:
-                logger.error(
-                    "Failed to rollback op %s: %s", op.metadata().name, e
-                )
+        if not succeeded:
+            return
+        builder = self._get_metadata_builder()
+        await _rollback_in_waves(
+            self._ops,
+            builder.rollback_waves(succeeded),
+            builder.op_names,
+            dry,
+            wet,
+        )
 
     async def perform(self, dry: DryContext, wet: WetContext) -> List[T]:
+        ops = self._ops
+        if not ops:
+            return []
+        # The token is mutated in place, never replaced, so hold it directly:
+        # the per-op check is a single slot read.
+        cancel = dry._cancel
+        if cancel.aborted:
+            # Nothing has run yet, so there is nothing to roll back
+            raise AbortedError(cancel.reason or _DEFAULT_BATCH_ABORT)
+
         results: List[T] = []
-        errors = []
-        succeeded_ops: List[Op[T]] = []
+        succeeded: List[int] = []
+        pure_results: Dict[Op[T], T] = {}
 
-        for index, op in enumerate(self._ops):
-            if dry.is_aborted():
-                await self._rollback_succeeded_ops(succeeded_ops, dry, wet)
-                reason = dry.abort_reason() or "Batch operation aborted"
-                raise AbortedError(reason)
+        for index, op in enumerate(ops):
+            if cancel.aborted:
+                await self._rollback_succeeded_ops(succeeded, dry, wet)
+                raise AbortedError(cancel.reason or _DEFAULT_BATCH_ABORT)
 
             try:
-                result = await op.perform(dry, wet)
+                # Ops that define __eq__ without __hash__ cannot be keys
+                if op.pure and type(op).__hash__ is not None:
+                    result = pure_results.get(op, _MISSING)
+                    if result is _MISSING:
+                        result = await op.perform(dry, wet)
+                        pure_results[op] = result
+                        # Only ops that actually ran are rolled back
+                        succeeded.append(index)
+                else:
+                    if pure_results:
+                        # The contexts may change from here on
+                        pure_results.clear()
+                    result = await op.perform(dry, wet)
+                    succeeded.append(index)
                 results.append(result)
-                succeeded_ops.append(op)
-            except AbortedError as e:
-                await self._rollback_succeeded_ops(succeeded_ops, dry, wet)
+            except (AbortedError, asyncio.CancelledError):
+                # Cancellation (e.g. TimeBoundWrapper on abort) unwinds too
+                await self._rollback_succeeded_ops(succeeded, dry, wet)
                 raise
             except Exception as e:
+                # The error policy is only consulted on failure
                 if self._continue_on_error:
-                    errors.append((index, e))
-                else:
-                    await self._rollback_succeeded_ops(succeeded_ops, dry, wet)
-                    raise BatchFailedError(
-                        f"Op {index}-{op.metadata().name} failed: {e}"
-                    )
+                    # Failed ops contribute no result; keep going
+                    continue
+                await self._rollback_succeeded_ops(succeeded, dry, wet)
+                name = self._get_metadata_builder().op_names[index]
+                raise BatchFailedError(f"Op {index}-{name} failed: {e}")
 
         return results
 
     def metadata(self) -> OpMetadata:
-        return BatchMetadataBuilder(self._ops).build()
+        return self._get_metadata_builder().build()
 
     async def rollback(self, dry: DryContext, wet: WetContext) -> None:
         pass
+
+
+async def _rollback_in_waves(
+    ops: Sequence[Op],
+    waves: List[List[int]],
+    names: Sequence[str],
+    dry: DryContext,
+    wet: WetContext,
+    scope: str = "",
+) -> None:
+    """Roll back ops wave by wave, as planned by BatchMetadataBuilder.rollback_waves.
+
+    Ops that inherit the no-op Op.rollback are skipped rather than awaited.
+    Single-op waves are awaited directly; larger waves run concurrently with
+    asyncio.gather. Rollback failures are logged, not raised. scope is
+    appended to the log messages (e.g. " in loop iteration").
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for wave in waves:
+        pending = [
+            index for index in wave if type(ops[index]).rollback is not _NO_ROLLBACK
+        ]
+        if debug and len(pending) < len(wave):
+            for index in wave:
+                if index not in pending:
+                    logger.debug(
+                        "Successfully rolled back op %s%s", names[index], scope
+                    )
+        if not pending:
+            continue
+        wave = pending
+        if len(wave) == 1:
+            index = wave[0]
+            try:
+                await ops[index].rollback(dry, wet)
+                if debug:
+                    logger.debug(
+                        "Successfully rolled back op %s%s", names[index], scope
+                    )
+            except Exception as e:
+                logger.error(
+                    "Failed to rollback op %s%s: %s", names[index], scope, e
+                )
+            continue
+
+        outcomes = await asyncio.gather(
+            *(ops[index].rollback(dry, wet) for index in wave),
+            return_exceptions=True,
+        )
+        for index, outcome in zip(wave, outcomes):
+            if outcome is None:
+                if debug:
+                    logger.debug(
+                        "Successfully rolled back op %s%s", names[index], scope
+                    )
+            elif isinstance(outcome, Exception):
+                logger.error(
+                    "Failed to rollback op %s%s: %s", names[index], scope, outcome
+                )
+            else:
+                raise outcome
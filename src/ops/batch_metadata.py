@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 from ops.op_metadata import OpMetadata
 
@@ -15,41 +15,104 @@ class BatchMetadataBuilder:
 
     def __init__(self, ops: List["Op"]) -> None:
         self._ops_metadata = [op.metadata() for op in ops]
+        self.op_names: Tuple[str, ...] = tuple(m.name for m in self._ops_metadata)
+        self._built: Optional[OpMetadata] = None
 
     def build(self) -> OpMetadata:
+        if self._built is not None:
+            return self._built
         input_schema, outputs_by_index = self._analyze_input_requirements()
         reference_schema = self._merge_reference_schemas()
         output_schema = self._construct_output_schema(outputs_by_index)
-        return (
-            OpMetadata.builder("BatchOp")
-            .description(
+        self._built = OpMetadata(
+            name="BatchOp",
+            input_schema=input_schema,
+            reference_schema=reference_schema,
+            output_schema=output_schema,
+            description=(
                 f"Batch of {len(self._ops_metadata)} operations with data flow analysis"
-            )
-            .input_schema(input_schema)
-            .reference_schema(reference_schema)
-            .output_schema(output_schema)
-            .build()
+            ),
         )
+        return self._built
 
     def _analyze_input_requirements(self):
         required_inputs: Set[str] = set()
         available_outputs: Set[str] = set()
         outputs_by_index: Dict[int, Set[str]] = {}
+        # First schema declared for each input property, in declaration order
+        declared_properties: Dict[str, Any] = {}
 
         for index, metadata in enumerate(self._ops_metadata):
-            if metadata.input_schema is not None:
-                required_fields = self._extract_required_fields(metadata.input_schema)
+            input_schema = metadata.input_schema
+            if input_schema is not None:
+                required_fields = self._extract_required_fields(input_schema)
                 for field in required_fields:
                     if field not in available_outputs:
                         required_inputs.add(field)
+                schema_props = input_schema.get("properties", {})
+                if isinstance(schema_props, dict):
+                    for field_name, field_schema in schema_props.items():
+                        declared_properties.setdefault(field_name, field_schema)
 
             op_outputs = self._extract_output_fields(metadata.output_schema)
             outputs_by_index[index] = op_outputs
             available_outputs.update(op_outputs)
 
-        schema = self._build_input_schema_from_requirements(required_inputs)
+        properties = {
+            name: field_schema
+            for name, field_schema in declared_properties.items()
+            if name in required_inputs
+        }
+        schema = {
+            "type": "object",
+            "properties": properties,
+            "required": list(properties),
+            "additionalProperties": False,
+        }
         return schema, outputs_by_index
 
+    def rollback_waves(self, indices: Sequence[int]) -> List[List[int]]:
+        """Group succeeded op indices (in execution order) into LIFO rollback waves.
+
+        Consecutive ops share a wave only when every one of them declares
+        rollback_parallel_safe and no data flows between them; all other ops
+        get a wave of their own, preserving strict reverse order.
+        """
+        waves: List[List[int]] = []
+        wave: List[int] = []
+        wave_parallel = False
+        wave_reads: Set[str] = set()
+        wave_writes: Set[str] = set()
+
+        for index in reversed(indices):
+            metadata = self._ops_metadata[index]
+            parallel = metadata.rollback_parallel_safe
+            reads = set(self._extract_required_fields(metadata.input_schema))
+            writes = self._extract_output_fields(metadata.output_schema)
+
+            if (
+                wave
+                and parallel
+                and wave_parallel
+                and not writes & (wave_reads | wave_writes)
+                and not reads & wave_writes
+            ):
+                wave.append(index)
+                wave_reads |= reads
+                wave_writes |= writes
+                continue
+
+            if wave:
+                waves.append(wave)
+            wave = [index]
+            wave_parallel = parallel
+            wave_reads = reads
+            wave_writes = writes
+
+        if wave:
+            waves.append(wave)
+        return waves
+
     def _extract_required_fields(self, schema: Optional[Dict]) -> List[str]:
         if not isinstance(schema, dict):
             return []
@@ -67,30 +130,6 @@ class BatchMetadataBuilder:
             fields.add("result")
         return fields
 
-    def _build_input_schema_from_requirements(
-        self, required_fields: Set[str]
-    ) -> Dict[str, Any]:
-        properties: Dict[str, Any] = {}
-        required: List[str] = []
-
-        for metadata in self._ops_metadata:
-            if metadata.input_schema is None:
-                continue
-            schema_props = metadata.input_schema.get("properties", {})
-            if not isinstance(schema_props, dict):
-                continue
-            for field_name, field_schema in schema_props.items():
-                if field_name in required_fields and field_name not in properties:
-                    properties[field_name] = field_schema
-                    required.append(field_name)
-
-        return {
-            "type": "object",
-            "properties": properties,
-            "required": required,
-            "additionalProperties": False,
-        }
-
     def _merge_reference_schemas(self) -> Dict[str, Any]:
         all_properties: Dict[str, Any] = {}
         all_required: Set[str] = set()
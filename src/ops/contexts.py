@@ -6,11 +6,27 @@ WetContext: non-serializable runtime references (services, connections, etc.).
 
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, Dict, Iterator, Optional, TYPE_CHECKING
-
+import asyncio
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+
+from ops import _json
 from ops.error import ContextError
 
+# Sentinel distinguishing a missing key from a stored None in one lookup.
+_MISSING: Final[Any] = object()
+
 
 def _json_type_name(value: Any) -> str:
     """Return the JSON type name of a Python value."""
@@ -29,27 +45,97 @@ def _json_type_name(value: Any) -> str:
     return "unknown"
 
 
+class CancellationToken:
+    """Abort flag and reason shared by every op performing on a DryContext.
+
+    Ops that check between steps read the aborted slot; code that awaits
+    can instead await wait(), which wakes as soon as cancel() is called.
+    """
+
+    __slots__ = ("aborted", "reason", "_waiters")
+
+    def __init__(self, aborted: bool = False, reason: Optional[str] = None) -> None:
+        self.aborted = aborted
+        self.reason = reason
+        # Futures of pending wait() calls, made per wait so the token is not
+        # tied to one event loop; the list itself is created on first wait.
+        self._waiters: Optional[List["asyncio.Future[None]"]] = None
+
+    def cancel(self, reason: Optional[str]) -> None:
+        """Set the flag and reason and wake every pending wait()."""
+        self.aborted = True
+        self.reason = reason
+        if self._waiters:
+            for waiter in self._waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def reset(self) -> None:
+        """Clear the flag and reason."""
+        self.aborted = False
+        self.reason = None
+
+    async def wait(self) -> None:
+        """Return once the token is cancelled (immediately if it already is)."""
+        if self.aborted:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        if self._waiters is None:
+            self._waiters = []
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._waiters.remove(waiter)
+
+    def __repr__(self) -> str:
+        return f"CancellationToken(aborted={self.aborted}, reason={self.reason!r})"
+
+
 class DryContext:
     """Serializable context holding plain data values."""
 
+    __slots__ = ("_values", "_shared", "_pinned", "_cancel", "_loop_stack")
+
     def __init__(self) -> None:
         self._values: Dict[str, Any] = {}
-        self._aborted: bool = False
-        self._abort_reason: Optional[str] = None
+        # True while _values may be referenced by a clone; copied on first write.
+        self._shared: bool = False
+        # True once values() handed out a view of _values; clones then copy
+        # eagerly, so the dict is never swapped out from under the view.
+        self._pinned: bool = False
+        # Package-internal: BatchOp/LoopOp read the token's slots directly.
+        self._cancel = CancellationToken()
+        # Frames of running LoopOps, innermost last; runtime state, never
+        # serialized.
+        self._loop_stack: List[Any] = []
 
     @classmethod
     def _from_parts(
         cls,
         values: Dict[str, Any],
-        aborted: bool,
-        abort_reason: Optional[str],
+        cancel: CancellationToken,
+        loop_stack: List[Any],
+        shared: bool = False,
     ) -> "DryContext":
         ctx = cls.__new__(cls)
         ctx._values = values
-        ctx._aborted = aborted
-        ctx._abort_reason = abort_reason
+        ctx._shared = shared
+        ctx._pinned = False
+        ctx._cancel = cancel
+        ctx._loop_stack = loop_stack
         return ctx
 
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> "DryContext":
+        """Build a context holding a copy of values, in one dict copy."""
+        return cls._from_parts(dict(values), CancellationToken(), [])
+
+    def _unshare(self) -> None:
+        """Take a private copy of values shared with a clone."""
+        self._values = dict(self._values)
+        self._shared = False
+
     def with_value(self, key: str, value: Any) -> "DryContext":
         """Builder pattern: insert a value and return self."""
         self.insert(key, value)
@@ -57,32 +143,52 @@ class DryContext:
 
     def insert(self, key: str, value: Any) -> None:
         """Insert a serializable value."""
+        if self._shared:
+            self._unshare()
         self._values[key] = value
 
-    def get(self, key: str, expected_type: type = None) -> Any:
+    def insert_many(self, values: Mapping[str, Any]) -> None:
+        """Insert every key/value pair of values in one dict update."""
+        if self._shared:
+            self._unshare()
+        self._values.update(values)
+
+    def remove(self, key: str) -> Any:
+        """Remove key and return its value, or None if not found."""
+        if self._values.get(key, _MISSING) is _MISSING:
+            return None
+        if self._shared:
+            self._unshare()
+        return self._values.pop(key)
+
+    def get(self, key: str, expected_type: Optional[type] = None) -> Any:
         """Return the value for key, or None if not found.
 
         If expected_type is given, returns None on type mismatch instead of raising.
         """
-        value = self._values.get(key)
-        if value is None and key not in self._values:
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
             return None
         if expected_type is not None and not isinstance(value, expected_type):
             return None
         return value
 
-    def get_required(self, key: str, expected_type: type = None) -> Any:
+    def get_or(self, key: str, default: Any) -> Any:
+        """Return the value for key, or default if not found (one dict lookup)."""
+        return self._values.get(key, default)
+
+    def get_required(self, key: str, expected_type: Optional[type] = None) -> Any:
         """Return the value for key, raising ContextError if missing or wrong type."""
-        if key not in self._values:
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
             raise ContextError(f"Required dry context key '{key}' not found")
-        value = self._values[key]
         if expected_type is not None and not isinstance(value, expected_type):
             actual_type = _json_type_name(value)
             expected_name = expected_type.__name__
             raise ContextError(
                 f"Type mismatch for dry context key '{key}': "
                 f"expected type '{expected_name}', "
-                f"but found '{actual_type}' value: {json.dumps(value)}"
+                f"but found '{actual_type}' value: {_json.dumps(value)}"
             )
         return value
 
@@ -94,15 +200,25 @@ class DryContext:
         """Iterate over all keys."""
         return iter(self._values.keys())
 
-    def values(self) -> Dict[str, Any]:
-        """Return the raw values dict."""
-        return self._values
+    def values(self) -> Mapping[str, Any]:
+        """Return a read-only live view of the values.
+
+        The view is a MappingProxyType, not a dict: serialize dict(view)
+        (json.dumps rejects the proxy itself).
+        """
+        if self._shared:
+            self._unshare()
+        self._pinned = True
+        return MappingProxyType(self._values)
 
     def get_or_insert_with(self, key: str, factory: Callable[[], Any]) -> Any:
         """Return existing value or insert via factory and return new value."""
-        if key in self._values:
-            return self._values[key]
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         new_value = factory()
+        if self._shared:
+            self._unshare()
         self._values[key] = new_value
         return new_value
 
@@ -110,9 +226,12 @@ class DryContext:
         self, key: str, computer: Callable[["DryContext", str], Any]
     ) -> Any:
         """Return existing value or compute via closure that receives context and key."""
-        if key in self._values:
-            return self._values[key]
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         new_value = computer(self, key)
+        if self._shared:
+            self._unshare()
         self._values[key] = new_value
         return new_value
 
@@ -123,9 +242,12 @@ class DryContext:
         factory: Callable[["DryContext", "WetContext", str], Any],
     ) -> Any:
         """Async: return existing value or compute via async factory."""
-        if key in self._values:
-            return self._values[key]
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         new_value = await factory(self, wet, key)
+        if self._shared:
+            self._unshare()
         self._values[key] = new_value
         return new_value
 
@@ -134,35 +256,65 @@ class DryContext:
 
         Abort flag is inherited only if self is not already aborted.
         """
+        if self._shared:
+            self._unshare()
         self._values.update(other._values)
-        if other._aborted and not self._aborted:
-            self._aborted = True
-            self._abort_reason = other._abort_reason
+        if other._cancel.aborted and not self._cancel.aborted:
+            self._cancel.cancel(other._cancel.reason)
 
     def set_abort(self, reason: Optional[str]) -> None:
         """Set the abort flag with optional reason."""
-        self._aborted = True
-        self._abort_reason = reason
+        self._cancel.cancel(reason)
 
     def is_aborted(self) -> bool:
         """Check if abort flag is set."""
-        return self._aborted
+        return self._cancel.aborted
 
     def abort_reason(self) -> Optional[str]:
         """Return the abort reason if set."""
-        return self._abort_reason
+        return self._cancel.reason
+
+    def cancellation_token(self) -> CancellationToken:
+        """Return the token behind set_abort/is_aborted.
+
+        The same object for the context's lifetime, so an op may hold it and
+        check token.aborted instead of calling is_aborted() repeatedly.
+        """
+        return self._cancel
+
+    def current_loop(self) -> Optional[Any]:
+        """Return the innermost running loop's LoopFrame on this context, if any.
+
+        Inner ops call signal_continue()/signal_break() on it instead of
+        setting the formatted __continue_loop_<id> keys; frame.loop is the
+        LoopOp itself.
+        """
+        stack = self._loop_stack
+        return stack[-1] if stack else None
 
     def clear_control_flags(self) -> None:
         """Clear all control flags."""
-        self._aborted = False
-        self._abort_reason = None
+        self._cancel.reset()
 
     def clone(self) -> "DryContext":
-        """Return an independent deep copy."""
+        """Return an independent copy.
+
+        The values dict is shared copy-on-write: neither side pays for the
+        copy until one of them is first mutated. A context whose values()
+        view was handed out copies at once instead, keeping that view live.
+        The clone gets its own cancellation token in the same state.
+        """
+        cancel = self._cancel
+        if self._pinned:
+            values = dict(self._values)
+        else:
+            self._shared = True
+            values = self._values
         return DryContext._from_parts(
-            dict(self._values),
-            self._aborted,
-            self._abort_reason,
+            values,
+            CancellationToken(cancel.aborted, cancel.reason),
+            list(self._loop_stack),
+            shared=not self._pinned,
         )
 
     def __copy__(self) -> "DryContext":
@@ -173,30 +325,36 @@ class DryContext:
         data = {
             "values": self._values,
             "control_flags": {
-                "aborted": self._aborted,
-                "abort_reason": self._abort_reason,
+                "aborted": self._cancel.aborted,
+                "abort_reason": self._cancel.reason,
             },
         }
-        return json.dumps(data)
+        return _json.dumps(data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "DryContext":
+    def from_json(cls, json_str: Union[str, bytes]) -> "DryContext":
         """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        data = _json.loads(json_str)
         ctx = cls.__new__(cls)
         ctx._values = data.get("values", {})
+        ctx._shared = False
+        ctx._pinned = False
         flags = data.get("control_flags", {})
-        ctx._aborted = flags.get("aborted", False)
-        ctx._abort_reason = flags.get("abort_reason", None)
+        ctx._cancel = CancellationToken(
+            flags.get("aborted", False), flags.get("abort_reason", None)
+        )
+        ctx._loop_stack = []
         return ctx
 
     def __repr__(self) -> str:
-        return f"DryContext(keys={list(self._values.keys())}, aborted={self._aborted})"
+        return f"DryContext(keys={list(self._values.keys())}, aborted={self._cancel.aborted})"
 
 
 class WetContext:
     """Non-serializable context holding runtime references."""
 
+    __slots__ = ("_references",)
+
     def __init__(self) -> None:
         self._references: Dict[str, Any] = {}
 
@@ -209,24 +367,28 @@ class WetContext:
         """Insert a runtime reference."""
         self._references[key] = value
 
+    def insert_refs(self, references: Mapping[str, Any]) -> None:
+        """Insert every runtime reference of references in one dict update."""
+        self._references.update(references)
+
     def insert_arc(self, key: str, value: Any) -> None:
         """Insert a runtime reference (alias for insert_ref)."""
         self._references[key] = value
 
-    def get_ref(self, key: str, expected_type: type = None) -> Optional[Any]:
+    def get_ref(self, key: str, expected_type: Optional[type] = None) -> Optional[Any]:
         """Return the reference for key, or None if missing or wrong type."""
-        value = self._references.get(key)
-        if value is None and key not in self._references:
+        value = self._references.get(key, _MISSING)
+        if value is _MISSING:
             return None
         if expected_type is not None and not isinstance(value, expected_type):
             return None
         return value
 
-    def get_required(self, key: str, expected_type: type = None) -> Any:
+    def get_required(self, key: str, expected_type: Optional[type] = None) -> Any:
         """Return the reference for key, raising ContextError if missing or wrong type."""
-        if key not in self._references:
+        value = self._references.get(key, _MISSING)
+        if value is _MISSING:
             raise ContextError(f"Required wet context reference '{key}' not found")
-        value = self._references[key]
         if expected_type is not None and not isinstance(value, expected_type):
             expected_name = expected_type.__name__
             raise ContextError(
@@ -235,6 +397,10 @@ class WetContext:
             )
         return value
 
+    def remove_ref(self, key: str) -> Any:
+        """Remove a reference and return it, or None if not found."""
+        return self._references.pop(key, None)
+
     def contains(self, key: str) -> bool:
         """Check if key exists."""
         return key in self._references
@@ -250,8 +416,9 @@ class WetContext:
         factory: Callable[["DryContext", "WetContext", str], Any],
     ) -> Any:
         """Async: return existing reference or create via async factory."""
-        if key in self._references:
-            return self._references[key]
+        value = self._references.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         new_value = await factory(dry, self, key)
         self._references[key] = new_value
         return new_value
@@ -1,25 +1,31 @@
 """OpError — error variants for the ops framework.
 
 Mirrors Rust's OpError enum with Python exception hierarchy.
+
+Each variant formats its display message once, in __init__, and hands it to
+Exception; str() then returns it without re-formatting.
 """
 
 import copy
+from typing import Any, Optional, Tuple, Union
+
+from ops import _json
 
 
 class OpError(Exception):
     """Base class for all ops errors."""
-    pass
+
+    __slots__ = ()
 
 
 class ExecutionFailedError(OpError):
     """Op execution failed with a message."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Op execution failed: {self.message}"
+        super().__init__(f"Op execution failed: {message}")
 
     def __copy__(self) -> "ExecutionFailedError":
         return ExecutionFailedError(self.message)
@@ -28,12 +34,11 @@ class ExecutionFailedError(OpError):
 class TimeoutError(OpError):
     """Op timed out after specified duration."""
 
+    __slots__ = ("timeout_ms",)
+
     def __init__(self, timeout_ms: int):
         self.timeout_ms = timeout_ms
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Op timeout after {self.timeout_ms}ms"
+        super().__init__(f"Op timeout after {timeout_ms}ms")
 
     def __copy__(self) -> "TimeoutError":
         return TimeoutError(self.timeout_ms)
@@ -42,12 +47,11 @@ class TimeoutError(OpError):
 class ContextError(OpError):
     """Context-related error (missing key, type mismatch, etc.)."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Context error: {self.message}"
+        super().__init__(f"Context error: {message}")
 
     def __copy__(self) -> "ContextError":
         return ContextError(self.message)
@@ -56,12 +60,11 @@ class ContextError(OpError):
 class BatchFailedError(OpError):
     """Batch op failed."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Batch op failed: {self.message}"
+        super().__init__(f"Batch op failed: {message}")
 
     def __copy__(self) -> "BatchFailedError":
         return BatchFailedError(self.message)
@@ -70,12 +73,11 @@ class BatchFailedError(OpError):
 class AbortedError(OpError):
     """Op was aborted."""
 
+    __slots__ = ("reason",)
+
     def __init__(self, reason: str):
         self.reason = reason
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Op aborted: {self.reason}"
+        super().__init__(f"Op aborted: {reason}")
 
     def __copy__(self) -> "AbortedError":
         return AbortedError(self.reason)
@@ -84,12 +86,11 @@ class AbortedError(OpError):
 class TriggerError(OpError):
     """Trigger-related error."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
-        super().__init__(str(self))
-
-    def __str__(self) -> str:
-        return f"Trigger error: {self.message}"
+        super().__init__(f"Trigger error: {message}")
 
     def __copy__(self) -> "TriggerError":
         return TriggerError(self.message)
@@ -98,18 +99,75 @@ class TriggerError(OpError):
 class OtherError(OpError):
     """Wraps any other error."""
 
+    __slots__ = ("wrapped",)
+
     def __init__(self, error: Exception):
         self.wrapped = error
         super().__init__(str(error))
 
-    def __str__(self) -> str:
-        return str(self.wrapped)
-
     def __copy__(self) -> "ExecutionFailedError":
         # Matches Rust Clone semantics: Other → ExecutionFailed preserving message
         return ExecutionFailedError(str(self.wrapped))
 
 
+# Per-variant wrappers for wrap_nested_op_exception, keyed by exact type.
+# Subclasses are resolved through their MRO on first sight and cached here.
+_NESTED_WRAPPERS = {
+    ExecutionFailedError: lambda name, e: ExecutionFailedError(
+        f"Op '{name}' failed: {e.message}"
+    ),
+    TimeoutError: lambda name, e: ExecutionFailedError(
+        f"Op '{name}' timed out after {e.timeout_ms}ms"
+    ),
+    ContextError: lambda name, e: ContextError(
+        f"Op '{name}' context error: {e.message}"
+    ),
+    BatchFailedError: lambda name, e: BatchFailedError(
+        f"Batch op '{name}' failed: {e.message}"
+    ),
+    AbortedError: lambda name, e: AbortedError(f"Op '{name}' aborted: {e.reason}"),
+    TriggerError: lambda name, e: TriggerError(
+        f"Op '{name}' internal error: {e.message}"
+    ),
+    OtherError: lambda name, e: ExecutionFailedError(
+        f"Op '{name}' failed: {e.wrapped}"
+    ),
+    # Fallback for bare OpError
+    OpError: lambda name, e: ExecutionFailedError(f"Op '{name}' failed: {e}"),
+}
+
+
+def wrap_nested_op_exception(trigger_name: str, error: OpError) -> OpError:
+    """Wrap an op error with the op name for context.
+
+    Equivalent to Rust's wrap_nested_op_exception(trigger_name, error).
+    """
+    error_type = type(error)
+    wrapper = _NESTED_WRAPPERS.get(error_type)
+    if wrapper is None:
+        wrapper = _NESTED_WRAPPERS[OpError]
+        for base in error_type.__mro__:
+            if base in _NESTED_WRAPPERS:
+                wrapper = _NESTED_WRAPPERS[base]
+                break
+        _NESTED_WRAPPERS[error_type] = wrapper
+    return wrapper(trigger_name, error)
+
+
 def op_error_from_json_error(err: Exception) -> OtherError:
     """Convert a JSON parsing error to OtherError (matches Rust From<serde_json::Error>)."""
     return OtherError(err)
+
+
+def parse_json_or_op_error(
+    data: Union[str, bytes],
+) -> Tuple[Any, Optional[OtherError]]:
+    """Parse JSON, returning (value, None) or (None, OtherError) on failure.
+
+    Invalid input is always reported by stdlib json, so the wrapped error
+    is a json.JSONDecodeError whether or not orjson is installed.
+    """
+    try:
+        return _json.loads(data), None
+    except ValueError as err:
+        return None, OtherError(err)
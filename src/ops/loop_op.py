@@ -2,18 +2,73 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
-import uuid as uuid_module
-from typing import Generic, List, Optional, TypeVar
+import os
+from typing import Generic, List, Optional, Tuple, TypeVar
 
 from ops.error import AbortedError, OpError
 from ops.op import Op
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
+from ops.batch import _rollback_in_waves
+from ops.batch_metadata import BatchMetadataBuilder
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# WetContext key under which a running LoopOp publishes its LoopFrame, so
+# inner ops can call signal_continue()/signal_break() on the innermost loop.
+# The same frame is returned by DryContext.current_loop(), which needs no key
+# lookup.
+CURRENT_LOOP_REF = "__current_loop"
+
+# DryContext key holding the innermost loop id (continue_loop!/break_loop!
+# convention carried over from the Rust macros).
+CURRENT_LOOP_ID_KEY = "__current_loop_id"
+
+_DEFAULT_LOOP_ABORT = "Loop operation aborted"
+
+# Loop ids only need to be unique per process; the pid prefix keeps the
+# serialized control-flag keys distinct across processes as well. A forked
+# child inherits both, so it takes a fresh prefix and counter.
+def _reset_loop_ids() -> None:
+    global _LOOP_ID_PREFIX, _loop_ids
+    _LOOP_ID_PREFIX = f"{os.getpid():x}"
+    _loop_ids = itertools.count()
+
+
+_reset_loop_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_loop_ids)
+
+
+class LoopFrame:
+    """Control-flow state of one running LoopOp.perform call.
+
+    Each perform gets its own frame, so concurrent performs of the same
+    LoopOp do not see each other's continue/break signals.
+    """
+
+    __slots__ = ("loop", "continue_flag", "break_flag")
+
+    def __init__(self, loop: "LoopOp") -> None:
+        self.loop = loop
+        self.continue_flag = False
+        self.break_flag = False
+
+    def signal_continue(self) -> None:
+        """Skip the remaining ops of the current iteration."""
+        self.continue_flag = True
+
+    def signal_break(self) -> None:
+        """Stop the loop after the current op."""
+        self.break_flag = True
+
+    def __repr__(self) -> str:
+        return f"LoopFrame(loop_id={self.loop._loop_id!r})"
+
 
 class LoopOp(Op[List[T]], Generic[T]):
     """Executes a batch of ops repeatedly up to a limit, with scoped control flow."""
@@ -28,36 +83,60 @@ class LoopOp(Op[List[T]], Generic[T]):
         self._counter_var = counter_var
         self._limit = limit
         self._ops: List[Op[T]] = list(ops)
-        self._loop_id = str(uuid_module.uuid4())
+        self._loop_id = f"{_LOOP_ID_PREFIX}-{next(_loop_ids):x}"
         self._continue_var = f"__continue_loop_{self._loop_id}"
         self._break_var = f"__break_loop_{self._loop_id}"
         self._continue_on_error = continue_on_error
+        self._parallel = False
+        self._metadata: Optional[OpMetadata] = None
+        self._rollback_plan: Optional[BatchMetadataBuilder] = None
 
     def add_op(self, op: Op[T]) -> "LoopOp[T]":
         """Add an op to the loop (builder pattern)."""
         self._ops.append(op)
+        self._metadata = None
+        self._rollback_plan = None
         return self
 
     def with_continue_on_error(self, continue_on_error: bool) -> "LoopOp[T]":
         self._continue_on_error = continue_on_error
+        self._metadata = None
+        return self
+
+    def with_parallel_ops(self, parallel: bool) -> "LoopOp[T]":
+        """Run the ops of each iteration concurrently instead of in order.
+
+        Only for ops with no data dependency on each other. Results keep op
+        order, iterations still run one after another, and continue/break
+        signals take effect once the whole iteration has finished.
+        """
+        self._parallel = parallel
         return self
 
+    def _get_rollback_plan(self) -> BatchMetadataBuilder:
+        # Op names (for logging) and rollback waves; resolved on first use and
+        # kept until add_op
+        if self._rollback_plan is None:
+            self._rollback_plan = BatchMetadataBuilder(self._ops)
+        return self._rollback_plan
+
+    def _get_op_names(self) -> Tuple[str, ...]:
+        return self._get_rollback_plan().op_names
+
     async def _rollback_iteration_ops(
-        self, succeeded_ops: List[Op[T]], dry: DryContext, wet: WetContext
+        self, succeeded: List[int], dry: DryContext, wet: WetContext
     ) -> None:
-        for op in reversed(succeeded_ops):
-            try:
-                await op.rollback(dry, wet)
-                logger.debug(
-                    "Successfully rolled back op %s in loop iteration",
-                    op.metadata().name,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to rollback op %s in loop iteration: %s",
-                    op.metadata().name,
-                    e,
-                )
+        if not succeeded:
+            return
+        plan = self._get_rollback_plan()
+        await _rollback_in_waves(
+            self._ops,
+            plan.rollback_waves(succeeded),
+            plan.op_names,
+            dry,
+            wet,
+            scope=" in loop iteration",
+        )
 
     def _get_counter(self, dry: DryContext) -> int:
         val = dry.get(self._counter_var)
@@ -75,73 +154,212 @@ class LoopOp(Op[List[T]], Generic[T]):
         if not dry.contains(self._counter_var):
             self._set_counter(dry, counter)
 
-        # Store loop ID for scoped control flow
-        dry.insert("__current_loop_id", self._loop_id)
-
-        while counter < self._limit:
-            if dry.is_aborted():
-                reason = dry.abort_reason() or "Loop operation aborted"
-                raise AbortedError(reason)
-
-            # Clear scoped control flags for this iteration
-            dry.insert(self._continue_var, False)
-            dry.insert(self._break_var, False)
-
-            iteration_succeeded_ops: List[Op[T]] = []
-
-            for op in self._ops:
-                if dry.is_aborted():
-                    await self._rollback_iteration_ops(
-                        iteration_succeeded_ops, dry, wet
-                    )
-                    reason = dry.abort_reason() or "Loop operation aborted"
-                    raise AbortedError(reason)
-
-                try:
-                    result = await op.perform(dry, wet)
-                    results.append(result)
-                    iteration_succeeded_ops.append(op)
-
-                    # Check scoped continue flag
-                    if dry.get(self._continue_var) is True:
-                        dry.insert(self._continue_var, False)
-                        break  # continue to next iteration
-
-                    # Check scoped break flag
-                    if dry.get(self._break_var) is True:
-                        dry.insert(self._break_var, False)
-                        return results  # break out of entire loop
-
-                except AbortedError:
-                    await self._rollback_iteration_ops(
-                        iteration_succeeded_ops, dry, wet
-                    )
-                    raise
-                except Exception as e:
-                    if self._continue_on_error:
-                        logger.warning(
-                            "Operation %s failed in loop iteration %d: %s. "
-                            "Continuing with next iteration.",
-                            op.metadata().name,
-                            counter,
-                            e,
-                        )
-                        await self._rollback_iteration_ops(
-                            iteration_succeeded_ops, dry, wet
-                        )
-                        break  # continue to next iteration
-                    else:
-                        await self._rollback_iteration_ops(
-                            iteration_succeeded_ops, dry, wet
-                        )
-                        raise
-
-            counter += 1
-            self._set_counter(dry, counter)
+        # Publish this call's frame for scoped control flow
+        frame = LoopFrame(self)
+        previous_loop = wet.get_ref(CURRENT_LOOP_REF)
+        previous_loop_id = dry.get(CURRENT_LOOP_ID_KEY)
+        wet.insert_ref(CURRENT_LOOP_REF, frame)
+        dry.insert(CURRENT_LOOP_ID_KEY, self._loop_id)
+
+        ops = self._ops
+        limit = self._limit
+        counter_var = self._counter_var
+        continue_var = self._continue_var
+        break_var = self._break_var
+        continue_on_error = self._continue_on_error
+        parallel = self._parallel
+        cancel = dry._cancel
+        # Bound once: the list grows by one per op result
+        append_result = results.append
+        dry_insert = dry.insert
+        loop_stack = dry._loop_stack
+        loop_stack.append(frame)
+
+        try:
+            # Only child ops can set the abort flag, so besides this entry
+            # check it is enough to test it before each op: the first op of an
+            # iteration sees whatever the previous iteration left behind.
+            if counter < limit and cancel.aborted:
+                raise AbortedError(cancel.reason or _DEFAULT_LOOP_ABORT)
+
+            while counter < limit:
+                # Clear scoped control flags for this iteration
+                frame.continue_flag = False
+                frame.break_flag = False
+
+                if parallel:
+                    if cancel.aborted:
+                        raise AbortedError(cancel.reason or _DEFAULT_LOOP_ABORT)
+                    if await self._perform_parallel_iteration(
+                        frame, counter, results, dry, wet
+                    ):
+                        return results
+                else:
+                    iteration_succeeded: List[int] = []
+
+                    for index, op in enumerate(ops):
+                        # Read the token directly: this runs once per child op.
+                        if cancel.aborted:
+                            await self._rollback_iteration_ops(
+                                iteration_succeeded, dry, wet
+                            )
+                            raise AbortedError(cancel.reason or _DEFAULT_LOOP_ABORT)
+
+                        try:
+                            result = await op.perform(dry, wet)
+                            append_result(result)
+                            iteration_succeeded.append(index)
+
+                            # Check scoped continue flag. Signals normally
+                            # arrive via frame.signal_continue();
+                            # legacy ops set a dry context key instead, which
+                            # is consumed so it is not serialized. The
+                            # membership test keeps the usual no-key case off
+                            # remove().
+                            if frame.continue_flag or (
+                                continue_var in dry._values
+                                and dry.remove(continue_var) is True
+                            ):
+                                frame.continue_flag = False
+                                break  # continue to next iteration
+
+                            # Check scoped break flag
+                            if frame.break_flag or (
+                                break_var in dry._values
+                                and dry.remove(break_var) is True
+                            ):
+                                frame.break_flag = False
+                                return results  # break out of entire loop
+
+                        except (AbortedError, asyncio.CancelledError):
+                            # Cancellation (e.g. TimeBoundWrapper on abort)
+                            # unwinds the iteration too
+                            await self._rollback_iteration_ops(
+                                iteration_succeeded, dry, wet
+                            )
+                            raise
+                        except Exception as e:
+                            if continue_on_error:
+                                logger.warning(
+                                    "Operation %s failed in loop iteration %d: %s. "
+                                    "Continuing with next iteration.",
+                                    self._get_op_names()[index],
+                                    counter,
+                                    e,
+                                )
+                                await self._rollback_iteration_ops(
+                                    iteration_succeeded, dry, wet
+                                )
+                                break  # continue to next iteration
+                            else:
+                                await self._rollback_iteration_ops(
+                                    iteration_succeeded, dry, wet
+                                )
+                                raise
+
+                counter += 1
+                dry_insert(counter_var, counter)
+
+            return results
+        finally:
+            # Hand scoped control flow back to an enclosing loop, if any.
+            # Concurrent loops on one context may finish out of order.
+            if loop_stack[-1] is frame:
+                loop_stack.pop()
+            else:
+                loop_stack.remove(frame)
+            # A finished top-level loop leaves no frame or id behind
+            if previous_loop is not None:
+                wet.insert_ref(CURRENT_LOOP_REF, previous_loop)
+            else:
+                wet.remove_ref(CURRENT_LOOP_REF)
+            if previous_loop_id is not None:
+                dry.insert(CURRENT_LOOP_ID_KEY, previous_loop_id)
+            else:
+                dry.remove(CURRENT_LOOP_ID_KEY)
+
+    async def _perform_parallel_iteration(
+        self,
+        frame: LoopFrame,
+        counter: int,
+        results: List[T],
+        dry: DryContext,
+        wet: WetContext,
+    ) -> bool:
+        """Run one iteration's ops with asyncio.gather; True means break.
+
+        On failure the ops that succeeded are rolled back and the results of
+        ops before the first failed one are kept, as in a sequential
+        iteration.
+        """
+        tasks = [asyncio.ensure_future(op.perform(dry, wet)) for op in self._ops]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            # gather cancels the pending ops; undo the ones that finished
+            await self._rollback_iteration_ops(
+                [
+                    index
+                    for index, task in enumerate(tasks)
+                    if task.done()
+                    and not task.cancelled()
+                    and task.exception() is None
+                ],
+                dry,
+                wet,
+            )
+            raise
+        failed = next(
+            (
+                index
+                for index, outcome in enumerate(outcomes)
+                if isinstance(outcome, BaseException)
+            ),
+            None,
+        )
+        if failed is None:
+            results.extend(outcomes)
+        else:
+            results.extend(outcomes[:failed])
+            await self._rollback_iteration_ops(
+                [
+                    index
+                    for index, outcome in enumerate(outcomes)
+                    if not isinstance(outcome, BaseException)
+                ],
+                dry,
+                wet,
+            )
+            error = outcomes[failed]
+            # An abort anywhere in the iteration wins over other failures
+            aborted = next(
+                (e for e in outcomes if isinstance(e, AbortedError)), None
+            )
+            if aborted is not None:
+                raise aborted
+            if not self._continue_on_error or not isinstance(error, Exception):
+                raise error
+            logger.warning(
+                "Operation %s failed in loop iteration %d: %s. "
+                "Continuing with next iteration.",
+                self._get_op_names()[failed],
+                counter,
+                error,
+            )
+            return False
 
-        return results
+        # Every op has already run, so continue only needs its legacy key
+        # consumed; break ends the loop after this iteration.
+        frame.continue_flag = False
+        dry.remove(self._continue_var)
+        if frame.break_flag or dry.remove(self._break_var) is True:
+            frame.break_flag = False
+            return True
+        return False
 
     def metadata(self) -> OpMetadata:
+        if self._metadata is not None:
+            return self._metadata
         if self._continue_on_error:
             desc = (
                 f"Loop {self._limit} times over {len(self._ops)} ops "
@@ -149,7 +367,8 @@ class LoopOp(Op[List[T]], Generic[T]):
             )
         else:
             desc = f"Loop {self._limit} times over {len(self._ops)} ops"
-        return OpMetadata.builder("LoopOp").description(desc).build()
+        self._metadata = OpMetadata(name="LoopOp", description=desc)
+        return self._metadata
 
     async def rollback(self, dry: DryContext, wet: WetContext) -> None:
         pass
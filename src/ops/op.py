@@ -5,11 +5,15 @@ Mirrors Rust's Op<T> async trait.
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Callable, ClassVar, Generic, TypeVar
 
 T = TypeVar("T")
 
+# Class attribute under which static_metadata stores each class's metadata.
+_STATIC_METADATA_ATTR = "_ops_static_metadata"
+
 
 class Op(ABC, Generic[T]):
     """Core operation interface.
@@ -17,6 +21,16 @@ class Op(ABC, Generic[T]):
     All ops implement perform() and metadata(). Rollback is optional (default no-op).
     """
 
+    __slots__ = ()
+
+    # A pure op only reads the contexts, and its result depends on nothing
+    # but the contexts and the op itself. BatchOp performs equal (==) pure
+    # ops once while no impure op has run in between, and reuses the result:
+    # the duplicates' entries are the same object, so a pure op should not
+    # return a result that callers mutate. Unhashable ops are always
+    # performed.
+    pure: ClassVar[bool] = False
+
     @abstractmethod
     async def perform(self, dry: "DryContext", wet: "WetContext") -> T:
         """Execute this operation."""
@@ -32,6 +46,29 @@ class Op(ABC, Generic[T]):
         pass
 
 
+def static_metadata(
+    method: Callable[[Op], "OpMetadata"],
+) -> Callable[[Op], "OpMetadata"]:
+    """Decorate Op.metadata to build it once per class and reuse it.
+
+    Only for ops whose metadata does not depend on instance state: the
+    first call on any instance of a class decides what every instance of
+    that class returns. Subclasses get their own entry.
+    """
+
+    @functools.wraps(method)
+    def metadata(self: Op) -> "OpMetadata":
+        cls = type(self)
+        # Read the class's own __dict__ so a subclass never sees its base's
+        meta = cls.__dict__.get(_STATIC_METADATA_ATTR)
+        if meta is None:
+            meta = method(self)
+            setattr(cls, _STATIC_METADATA_ATTR, meta)
+        return meta
+
+    return metadata
+
+
 if TYPE_CHECKING:
     from ops.contexts import DryContext, WetContext
     from ops.op_metadata import OpMetadata
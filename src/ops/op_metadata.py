@@ -5,37 +5,41 @@ from __future__ import annotations
 import json
 import uuid as uuid_module
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - declared dependency
+    jsonschema = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
 
 from ops.error import ContextError
 from ops.contexts import DryContext, WetContext
 
 
-class ValidationError:
+class ValidationError(NamedTuple):
     """A single validation error."""
 
-    def __init__(self, field: str, message: str) -> None:
-        self.field = field
-        self.message = message
-
-    def __repr__(self) -> str:
-        return f"ValidationError(field={self.field!r}, message={self.message!r})"
+    field: str
+    message: str
 
 
-class ValidationWarning:
+class ValidationWarning(NamedTuple):
     """A single validation warning."""
 
-    def __init__(self, field: str, message: str) -> None:
-        self.field = field
-        self.message = message
-
-    def __repr__(self) -> str:
-        return f"ValidationWarning(field={self.field!r}, message={self.message!r})"
+    field: str
+    message: str
 
 
 class ValidationReport:
     """Result of schema validation."""
 
+    __slots__ = ("is_valid", "errors", "warnings")
+
     def __init__(
         self,
         is_valid: bool,
@@ -57,31 +61,108 @@ class ValidationReport:
         return f"ValidationReport(is_valid={self.is_valid}, errors={self.errors})"
 
 
+# Compiled schemas keyed by schema identity. Entries keep the schema alive so
+# its id cannot be recycled while cached; the cache is bounded so throwaway
+# schemas built per metadata() call are not pinned forever.
+_SCHEMA_CACHE: Dict[int, "_CompiledSchema"] = {}
+_SCHEMA_CACHE_SIZE = 256
+
+
+class _CompiledSchema:
+    """A schema's root required fields and, on demand, its validators.
+
+    OpMetadata only needs the required fields; ValidatingWrapper calls
+    build_validators() once for the Draft-7 validator. With fastjsonschema
+    installed, accepts() runs a code-generated check first; jsonschema is
+    only consulted for values it rejects, so error messages keep their
+    jsonschema wording.
+    """
+
+    __slots__ = ("schema", "validator", "fast", "required", "required_set")
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
+        self.validator = None
+        self.fast = None
+        self.required: Tuple[str, ...] = tuple(schema.get("required", ()))
+        self.required_set = frozenset(self.required)
+
+    def build_validators(self) -> "_CompiledSchema":
+        """Compile the validators if not done yet; returns self."""
+        if self.validator is None and jsonschema is not None:
+            self.validator = jsonschema.Draft7Validator(self.schema)
+            if fastjsonschema is not None:
+                try:
+                    # use_default=False: validating must not fill in defaults
+                    self.fast = fastjsonschema.compile(
+                        self.schema, use_default=False
+                    )
+                except Exception:
+                    # Schemas fastjsonschema cannot compile use jsonschema alone
+                    self.fast = None
+        return self
+
+    def accepts(self, value: Any) -> bool:
+        """True if the fast validator is available and value passes it.
+
+        Only meaningful for plain JSON trees: fastjsonschema accepts tuples
+        as arrays, which Draft-7 (and jsonschema) rejects.
+        """
+        if self.fast is None:
+            return False
+        try:
+            self.fast(value)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+
+def _compile_schema(schema: Dict[str, Any]) -> _CompiledSchema:
+    """Return the cached compiled form of schema, compiling it on first use."""
+    compiled = _SCHEMA_CACHE.get(id(schema))
+    if compiled is not None and compiled.schema is schema:
+        return compiled
+    compiled = _CompiledSchema(schema)
+    if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_SIZE:
+        _SCHEMA_CACHE.pop(next(iter(_SCHEMA_CACHE)), None)
+    _SCHEMA_CACHE[id(schema)] = compiled
+    return compiled
+
+
 def _validate_against_schema(value: Any, schema: Dict[str, Any]) -> ValidationReport:
-    """Validate a value against a JSON Schema object (required fields only)."""
+    """Validate a value against a JSON Schema object (required fields only).
+
+    Full Draft-7 validation is ValidatingWrapper's job; metadata checks only
+    that top-level required fields are present, so e.g. a BatchOp's
+    additionalProperties: False does not reject contexts carrying extra keys.
+    """
     errors: List[ValidationError] = []
-    if isinstance(schema, dict) and isinstance(value, dict):
-        required = schema.get("required", [])
-        for field in required:
-            if field not in value:
-                errors.append(
-                    ValidationError(
-                        field=field,
-                        message=f"Required field '{field}' is missing",
+    if isinstance(schema, dict) and isinstance(value, Mapping):
+        compiled = _compile_schema(schema)
+        if compiled.required:
+            # One hashed set operation; a dict argument is probed, not iterated
+            missing = compiled.required_set.difference(value)
+            for field in compiled.required:
+                if field in missing:
+                    errors.append(
+                        ValidationError(
+                            field=field,
+                            message=f"Required field '{field}' is missing",
+                        )
                     )
-                )
     return ValidationReport(is_valid=len(errors) == 0, errors=errors, warnings=[])
 
 
 def _validate_reference_schema(
-    wet_keys: List[str], schema: Dict[str, Any]
+    wet_keys: Iterable[str], schema: Dict[str, Any]
 ) -> ValidationReport:
     """Validate that required references exist in wet context."""
     errors: List[ValidationError] = []
     if isinstance(schema, dict):
-        required = schema.get("required", [])
-        for field in required:
-            if field not in wet_keys:
+        compiled = _compile_schema(schema)
+        missing = compiled.required_set.difference(wet_keys)
+        for field in compiled.required:
+            if field in missing:
                 errors.append(
                     ValidationError(
                         field=field,
@@ -94,6 +175,15 @@ def _validate_reference_schema(
 class OpMetadata:
     """Metadata describing an op's name, schemas, and description."""
 
+    __slots__ = (
+        "name",
+        "input_schema",
+        "reference_schema",
+        "output_schema",
+        "description",
+        "rollback_parallel_safe",
+    )
+
     def __init__(
         self,
         name: str,
@@ -101,12 +191,16 @@ class OpMetadata:
         reference_schema: Optional[Dict[str, Any]] = None,
         output_schema: Optional[Dict[str, Any]] = None,
         description: Optional[str] = None,
+        rollback_parallel_safe: bool = False,
     ) -> None:
         self.name = name
         self.input_schema = input_schema
         self.reference_schema = reference_schema
         self.output_schema = output_schema
         self.description = description
+        # Rollback commutes with other parallel-safe ops that share no data
+        # flow, so BatchOp may roll them back concurrently.
+        self.rollback_parallel_safe = rollback_parallel_safe
 
     @classmethod
     def builder(cls, name: str) -> "OpMetadataBuilder":
@@ -116,14 +210,13 @@ class OpMetadata:
         """Validate dry context against input schema."""
         if self.input_schema is None:
             return ValidationReport.success()
-        return _validate_against_schema(ctx.values(), self.input_schema)
+        return _validate_against_schema(ctx._values, self.input_schema)
 
     def validate_wet_context(self, ctx: WetContext) -> ValidationReport:
         """Validate wet context against reference schema."""
         if self.reference_schema is None:
             return ValidationReport.success()
-        wet_keys = list(ctx.keys())
-        return _validate_reference_schema(wet_keys, self.reference_schema)
+        return _validate_reference_schema(ctx._references, self.reference_schema)
 
     def validate_contexts(
         self, dry: DryContext, wet: WetContext
@@ -131,6 +224,12 @@ class OpMetadata:
         """Validate both contexts."""
         dry_report = self.validate_dry_context(dry)
         wet_report = self.validate_wet_context(wet)
+        # Each report owns its lists, so an empty side lets the other's be
+        # reused instead of concatenated.
+        if not wet_report.errors and not wet_report.warnings:
+            return dry_report
+        if not dry_report.errors and not dry_report.warnings:
+            return wet_report
         return ValidationReport(
             is_valid=dry_report.is_valid and wet_report.is_valid,
             errors=dry_report.errors + wet_report.errors,
@@ -148,7 +247,12 @@ class OpMetadata:
 
 
 class OpMetadataBuilder:
-    """Fluent builder for OpMetadata."""
+    """Fluent builder for OpMetadata.
+
+    Convenient for op authors; code that builds metadata on a hot path
+    should call OpMetadata(...) with keyword arguments instead, which skips
+    the builder allocation and its setter calls.
+    """
 
     def __init__(self, name: str) -> None:
         self._name = name
@@ -156,6 +260,7 @@ class OpMetadataBuilder:
         self._reference_schema: Optional[Dict[str, Any]] = None
         self._output_schema: Optional[Dict[str, Any]] = None
         self._description: Optional[str] = None
+        self._rollback_parallel_safe = False
 
     def input_schema(self, schema: Dict[str, Any]) -> "OpMetadataBuilder":
         self._input_schema = schema
@@ -173,6 +278,10 @@ class OpMetadataBuilder:
         self._description = desc
         return self
 
+    def rollback_parallel_safe(self, safe: bool = True) -> "OpMetadataBuilder":
+        self._rollback_parallel_safe = safe
+        return self
+
     def build(self) -> OpMetadata:
         return OpMetadata(
             name=self._name,
@@ -180,12 +289,15 @@ class OpMetadataBuilder:
             reference_schema=self._reference_schema,
             output_schema=self._output_schema,
             description=self._description,
+            rollback_parallel_safe=self._rollback_parallel_safe,
         )
 
 
 class TriggerFuse:
     """Saved request to execute an op later."""
 
+    __slots__ = ("id", "trigger_name", "dry_context", "created_at", "metadata")
+
     def __init__(self, trigger_name: str) -> None:
         self.id = str(uuid_module.uuid4())
         self.trigger_name = trigger_name
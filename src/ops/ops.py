@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import inspect
+import sys
 from typing import TYPE_CHECKING
 
 from ops.error import (
@@ -14,8 +14,10 @@ from ops.error import (
     AbortedError,
     TriggerError,
     OtherError,
+    wrap_nested_op_exception,
 )
-from ops.wrappers.logging_wrapper import LoggingWrapper
+from ops._caller import file_stem
+from ops.wrappers.logging_wrapper import perform_logged
 
 if TYPE_CHECKING:
     from ops.op import Op
@@ -28,8 +30,8 @@ async def perform(op: "Op", dry: "DryContext", wet: "WetContext"):
     Equivalent to Java OPS.perform() / Rust perform().
     """
     trigger_name = get_caller_trigger_name()
-    logged_op = LoggingWrapper(op, trigger_name)
-    return await logged_op.perform(dry, wet)
+    # Same logging as LoggingWrapper(op, trigger_name), minus the allocation
+    return await perform_logged(op, trigger_name, dry, wet)
 
 
 def get_caller_trigger_name() -> str:
@@ -37,35 +39,11 @@ def get_caller_trigger_name() -> str:
 
     Equivalent to Rust's #[track_caller] / Location::caller().
     """
-    frame = inspect.stack()[1]
-    filename = frame.filename.split("/")[-1].replace(".py", "")
-    lineno = frame.lineno
-    return f"{filename}::{lineno}"
-
-
-def wrap_nested_op_exception(trigger_name: str, error: OpError) -> OpError:
-    """Wrap an op error with the op name for context.
-
-    Equivalent to Rust's wrap_nested_op_exception(trigger_name, error).
-    """
-    if isinstance(error, ExecutionFailedError):
-        return ExecutionFailedError(f"Op '{trigger_name}' failed: {error.message}")
-    if isinstance(error, TimeoutError):
-        return ExecutionFailedError(
-            f"Op '{trigger_name}' timed out after {error.timeout_ms}ms"
-        )
-    if isinstance(error, ContextError):
-        return ContextError(f"Op '{trigger_name}' context error: {error.message}")
-    if isinstance(error, BatchFailedError):
-        return BatchFailedError(f"Batch op '{trigger_name}' failed: {error.message}")
-    if isinstance(error, AbortedError):
-        return AbortedError(f"Op '{trigger_name}' aborted: {error.reason}")
-    if isinstance(error, TriggerError):
-        return TriggerError(f"Op '{trigger_name}' internal error: {error.message}")
-    if isinstance(error, OtherError):
-        return ExecutionFailedError(f"Op '{trigger_name}' failed: {error.wrapped}")
-    # Fallback for bare OpError
-    return ExecutionFailedError(f"Op '{trigger_name}' failed: {error}")
+    # _getframe reads one frame; inspect.stack() builds (and reads source
+    # context for) every frame on the stack.
+    frame = sys._getframe(1)
+    filename = file_stem(frame.f_code.co_filename)
+    return f"{filename}::{frame.f_lineno}"
 
 
 def wrap_nested_exception(error: Exception) -> OtherError:
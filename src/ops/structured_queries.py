@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlineEntry:
     """Hierarchical TOC entry."""
 
@@ -17,39 +17,23 @@ class OutlineEntry:
     children: List["OutlineEntry"] = field(default_factory=list)
 
     def with_type(self, entry_type: str) -> "OutlineEntry":
-        from dataclasses import replace
-        return replace(self, entry_type=entry_type)
+        return OutlineEntry(
+            self.title, self.level, self.page, entry_type, list(self.children)
+        )
 
     def with_children(self, children: List["OutlineEntry"]) -> "OutlineEntry":
-        from dataclasses import replace
-        return replace(self, children=list(children))
+        return OutlineEntry(
+            self.title, self.level, self.page, self.entry_type, list(children)
+        )
 
     def add_child(self, child: "OutlineEntry") -> None:
         self.children.append(child)
 
     def flatten(self) -> List["FlatOutlineEntry"]:
-        results: List[FlatOutlineEntry] = []
-        self._flatten_recursive([], results)
-        return results
-
-    def _flatten_recursive(
-        self, path: List[str], results: List["FlatOutlineEntry"]
-    ) -> None:
-        current_path = path + [self.title]
-        results.append(
-            FlatOutlineEntry(
-                title=self.title,
-                level=self.level,
-                page=self.page,
-                entry_type=self.entry_type,
-                path=list(current_path),
-            )
-        )
-        for child in self.children:
-            child._flatten_recursive(current_path, results)
+        return _flatten_entries([self])
 
 
-@dataclass
+@dataclass(slots=True)
 class FlatOutlineEntry:
     """Flattened outline entry with full hierarchical path."""
 
@@ -60,7 +44,7 @@ class FlatOutlineEntry:
     entry_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlineMetadata:
     """Statistics about a document outline."""
 
@@ -82,29 +66,53 @@ class ListingOutline:
         self.metadata: OutlineMetadata = OutlineMetadata()
 
     def flatten(self) -> List[FlatOutlineEntry]:
-        results: List[FlatOutlineEntry] = []
-        for entry in self.entries:
-            results.extend(entry.flatten())
-        return results
+        return _flatten_entries(self.entries)
 
     def entries_at_level(self, level: int) -> List[OutlineEntry]:
-        def collect(entries: List[OutlineEntry]) -> List[OutlineEntry]:
-            found = []
-            for e in entries:
-                if e.level == level:
-                    found.append(e)
-                found.extend(collect(e.children))
-            return found
-        return collect(self.entries)
+        found: List[OutlineEntry] = []
+        stack = list(reversed(self.entries))
+        while stack:
+            entry = stack.pop()
+            if entry.level == level:
+                found.append(entry)
+            stack.extend(reversed(entry.children))
+        return found
 
     def max_depth(self) -> int:
-        def depth(entry: OutlineEntry) -> int:
-            if not entry.children:
-                return entry.level
-            return max(depth(c) for c in entry.children)
         if not self.entries:
             return 0
-        return max(depth(e) for e in self.entries)
+        # Depth is the deepest leaf level, as in the Rust implementation
+        deepest = None
+        stack = list(self.entries)
+        while stack:
+            entry = stack.pop()
+            if entry.children:
+                stack.extend(entry.children)
+            elif deepest is None or entry.level > deepest:
+                deepest = entry.level
+        return deepest
+
+
+def _flatten_entries(entries: List[OutlineEntry]) -> List[FlatOutlineEntry]:
+    """Pre-order flatten of entries using an explicit stack (no recursion)."""
+    results: List[FlatOutlineEntry] = []
+    stack = [(entry, None) for entry in reversed(entries)]
+    while stack:
+        entry, parent_path = stack.pop()
+        # Each entry gets its own path list; children extend it by copying
+        path = [entry.title] if parent_path is None else parent_path + [entry.title]
+        results.append(
+            FlatOutlineEntry(
+                title=entry.title,
+                level=entry.level,
+                page=entry.page,
+                entry_type=entry.entry_type,
+                path=path,
+            )
+        )
+        for child in reversed(entry.children):
+            stack.append((child, path))
+    return results
 
 
 def generate_outline_schema() -> Dict[str, Any]:
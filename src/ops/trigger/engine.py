@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
 from ops.error import TriggerError
 from ops.contexts import DryContext, WetContext
+from ops.op import Op
 from ops.trigger.registry import TriggerRegistry
 from ops.trigger.trigger import Trigger
 
@@ -20,39 +22,84 @@ class TriggerEngine:
         self._primary = TriggerRegistry()
         self._secondary = TriggerRegistry()
 
-    async def tick(self, dry: DryContext, wet: WetContext) -> None:
-        """Evaluate all primary triggers and run actions when predicates hold."""
-        for trigger in self._primary.spawn_all():
-            name = trigger.predicate().metadata().name
-            should = await trigger.predicate().perform(dry, wet)
-            if should:
-                _log.debug(
-                    "[TriggerEngine] Predicate '%s' holds; running %d action(s)",
-                    name,
-                    len(trigger.actions()),
-                )
-                for action in trigger.actions():
-                    try:
-                        await action.perform(dry, wet)
-                    except Exception as e:
-                        raise TriggerError(
-                            f"Trigger action failed for predicate '{name}': {e}"
-                        )
-                _log.info(
-                    "[TriggerEngine] Completed actions for predicate '%s'", name
-                )
-            else:
-                _log.debug(
-                    "[TriggerEngine] Predicate '%s' not triggered", name
+    async def tick(
+        self, dry: DryContext, wet: WetContext, concurrent: bool = False
+    ) -> None:
+        """Evaluate all primary triggers and run actions when predicates hold.
+
+        With concurrent=True all predicates are awaited together via
+        asyncio.gather before any action runs, so I/O-bound predicates
+        overlap. If one predicate fails, the others are cancelled and awaited
+        before the error propagates. Only use it when predicates do not depend on each other's
+        (or on earlier actions') writes to the contexts. Actions always run
+        in registration order.
+        """
+        dbg = _log.isEnabledFor(logging.DEBUG)
+        if concurrent:
+            triggers = self._primary.spawn_all()
+            # predicate() / actions() may build fresh ops on every call
+            predicates = [trigger.predicate() for trigger in triggers]
+            tasks = [
+                asyncio.ensure_future(predicate.perform(dry, wet))
+                for predicate in predicates
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # Leave no predicate running against the contexts once the
+                # tick has failed or been cancelled
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            for trigger, predicate, should in zip(triggers, predicates, results):
+                await self._fire(trigger, predicate, should, dry, wet, dbg)
+        else:
+            # Spawn each trigger only when its turn comes
+            for trigger in self._primary.iter_spawned():
+                predicate = trigger.predicate()
+                should = await predicate.perform(dry, wet)
+                await self._fire(trigger, predicate, should, dry, wet, dbg)
+
+    async def _fire(
+        self,
+        trigger: Trigger,
+        predicate: Op[bool],
+        should: bool,
+        dry: DryContext,
+        wet: WetContext,
+        dbg: bool,
+    ) -> None:
+        """Run trigger's actions in order if its predicate held."""
+        name = predicate.metadata().name
+        if not should:
+            if dbg:
+                _log.debug("[TriggerEngine] Predicate '%s' not triggered", name)
+            return
+        actions = trigger.actions()
+        if dbg:
+            _log.debug(
+                "[TriggerEngine] Predicate '%s' holds; running %d action(s)",
+                name,
+                len(actions),
+            )
+        for action in actions:
+            try:
+                await action.perform(dry, wet)
+            except Exception as e:
+                raise TriggerError(
+                    f"Trigger action failed for predicate '{name}': {e}"
                 )
+        _log.info("[TriggerEngine] Completed actions for predicate '%s'", name)
 
     def spawn(self, name: str) -> Trigger:
         """Spawn a trigger from either registry."""
-        if self._primary.is_set(name):
-            return self._primary.spawn(name)
-        if self._secondary.is_set(name):
-            return self._secondary.spawn(name)
-        raise ValueError(f"Trigger '{name}' not found in either registry")
+        factory = self._primary.get_factory(name)
+        if factory is None:
+            factory = self._secondary.get_factory(name)
+            if factory is None:
+                raise ValueError(f"Trigger '{name}' not found in either registry")
+        return factory()
 
     def primary_registry(self) -> TriggerRegistry:
         return self._primary
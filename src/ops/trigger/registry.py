@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterator, List, Optional
 
 from ops.error import TriggerError
 from ops.trigger.trigger import Trigger
@@ -28,6 +28,10 @@ class TriggerRegistry:
         _log.info("Registered trigger %s", name)
         self._factories[name] = factory
 
+    def get_factory(self, trigger_name: str) -> Optional[TriggerFactory]:
+        """Return the factory registered for trigger_name, or None."""
+        return self._factories.get(trigger_name)
+
     def spawn(self, trigger_name: str) -> Trigger:
         """Create a trigger instance by name. Raises ValueError if not found."""
         factory = self._factories.get(trigger_name)
@@ -42,6 +46,14 @@ class TriggerRegistry:
         """Create all registered triggers."""
         return [factory() for factory in self._factories.values()]
 
+    def iter_spawned(self) -> Iterator[Trigger]:
+        """Create registered triggers lazily, one per step of iteration.
+
+        Factories are snapshotted first, so registering or unregistering
+        triggers mid-iteration does not disturb it.
+        """
+        return (factory() for factory in tuple(self._factories.values()))
+
     def list_names(self) -> List[str]:
         """Return all registered trigger names."""
         return list(self._factories.keys())
@@ -56,10 +68,7 @@ class TriggerRegistry:
 
     def unregister(self, trigger_name: str) -> bool:
         """Remove a trigger. Returns True if it was found and removed."""
-        if trigger_name in self._factories:
-            del self._factories[trigger_name]
-            return True
-        return False
+        return self._factories.pop(trigger_name, None) is not None
 
     def __repr__(self) -> str:
         return f"TriggerRegistry(triggers={self.list_names()})"
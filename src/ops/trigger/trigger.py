@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import List
 
 from ops.op import Op
@@ -40,6 +41,13 @@ class Trigger(ABC):
             await batch.perform(dry, wet)
 
     def metadata(self) -> OpMetadata:
+        return self._cached_metadata
+
+    @cached_property
+    def _cached_metadata(self) -> OpMetadata:
+        # name() and actions() are fixed for an instance; actions() may build
+        # new ops on every call, so only ask once. Each instance gets its own
+        # OpMetadata, since callers may mutate it.
         return OpMetadata(
             name=f"Trigger {self.name()} with {len(self.actions())} actions"
         )
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import logging
+import sys
 import time
-from typing import Generic, Optional, TypeVar
+from functools import lru_cache
+from typing import Dict, Generic, Optional, Tuple, TypeVar
 
+from ops._caller import file_stem
 from ops.op import Op
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
-from ops.error import OpError
+from ops.error import ExecutionFailedError, OpError
 
 T = TypeVar("T")
 
@@ -25,6 +28,14 @@ _log = logging.getLogger(__name__)
 class LoggingWrapper(Op[T], Generic[T]):
     """Wraps an op with logging of start, success, and failure."""
 
+    __slots__ = (
+        "_wrapped_op",
+        "_trigger_name",
+        "_logger_name",
+        "_extra",
+        "_messages",
+    )
+
     def __init__(
         self,
         op: Op[T],
@@ -34,6 +45,9 @@ class LoggingWrapper(Op[T], Generic[T]):
         self._wrapped_op = op
         self._trigger_name = trigger_name
         self._logger_name = logger_name
+        # Built once; every log record of this wrapper carries the same extra
+        self._extra = {"logger": self._get_logger_name()}
+        self._messages = _log_messages(trigger_name)
 
     @classmethod
     def with_logger(
@@ -44,61 +58,10 @@ class LoggingWrapper(Op[T], Generic[T]):
     def _get_logger_name(self) -> str:
         return self._logger_name or "LoggingWrapper"
 
-    def _log_op_start(self) -> None:
-        _log.info(
-            "%sStarting op: %s%s",
-            YELLOW,
-            self._trigger_name,
-            RESET,
-            extra={"logger": self._get_logger_name()},
-        )
-
-    def _log_op_success(self, duration_s: float) -> None:
-        _log.info(
-            "%sOp '%s' completed in %.3f seconds%s",
-            GREEN,
-            self._trigger_name,
-            duration_s,
-            RESET,
-            extra={"logger": self._get_logger_name()},
-        )
-
-    def _log_op_failure(self, error: Exception, duration_s: float) -> None:
-        _log.error(
-            "%sOp '%s' failed after %.3f seconds: %r%s",
-            RED,
-            self._trigger_name,
-            duration_s,
-            error,
-            RESET,
-            extra={"logger": self._get_logger_name()},
-        )
-
     async def perform(self, dry: DryContext, wet: WetContext) -> T:
-        start = time.monotonic()
-        self._log_op_start()
-
-        try:
-            result = await self._wrapped_op.perform(dry, wet)
-        except Exception as error:
-            duration_s = time.monotonic() - start
-            self._log_op_failure(error, duration_s)
-            # Re-wrap with op context (matches Rust/Java behavior)
-            from ops.error import ExecutionFailedError
-            from ops.ops import wrap_nested_op_exception
-            if isinstance(error, OpError):
-                raise wrap_nested_op_exception(
-                    self._trigger_name,
-                    ExecutionFailedError(repr(error)),
-                ) from None
-            raise wrap_nested_op_exception(
-                self._trigger_name,
-                ExecutionFailedError(str(error)),
-            ) from None
-
-        duration_s = time.monotonic() - start
-        self._log_op_success(duration_s)
-        return result
+        return await _perform_logged(
+            self._wrapped_op, self._messages, self._extra, dry, wet
+        )
 
     def metadata(self) -> OpMetadata:
         return self._wrapped_op.metadata()
@@ -107,11 +70,87 @@ class LoggingWrapper(Op[T], Generic[T]):
         await self._wrapped_op.rollback(dry, wet)
 
 
+# Log-record extra for callers that do not name a logger
+_DEFAULT_EXTRA = {"logger": "LoggingWrapper"}
+
+
+_Messages = Tuple[str, str, str, str]
+
+
+@lru_cache(maxsize=256)
+def _log_messages(trigger_name: str) -> _Messages:
+    """Return the start message, success/failure formats and error prefix.
+
+    Colors and name are baked in once, so a record only substitutes the
+    elapsed time (and error). The start message is logged without args and
+    is therefore not %-formatted at all. The last entry prefixes the
+    re-raised error's message.
+    """
+    name = trigger_name.replace("%", "%%")
+    return (
+        f"{YELLOW}Starting op: {trigger_name}{RESET}",
+        f"{GREEN}Op '{name}' completed in %.3f seconds{RESET}",
+        f"{RED}Op '{name}' failed after %.3f seconds: %r{RESET}",
+        f"Op '{trigger_name}' failed: ",
+    )
+
+
+async def perform_logged(
+    op: Op[T], trigger_name: str, dry: DryContext, wet: WetContext
+) -> T:
+    """Perform op with the logging of LoggingWrapper(op, trigger_name).
+
+    For one-off calls (e.g. ops.perform) that would otherwise build a
+    wrapper only to use it once.
+    """
+    return await _perform_logged(
+        op, _log_messages(trigger_name), _DEFAULT_EXTRA, dry, wet
+    )
+
+
+async def _perform_logged(
+    op: Op[T],
+    messages: _Messages,
+    extra: Dict[str, str],
+    dry: DryContext,
+    wet: WetContext,
+) -> T:
+    """Run op with start/success/failure logging, without a wrapper instance.
+
+    messages comes from _log_messages(trigger_name). Shared by
+    LoggingWrapper.perform and perform_logged.
+    """
+    # The start sample is only read by the success (INFO) and failure
+    # (ERROR) records; ERROR is enabled whenever INFO is.
+    start = time.monotonic() if _log.isEnabledFor(logging.ERROR) else 0.0
+    if _log.isEnabledFor(logging.INFO):
+        _log.info(messages[0], extra=extra)
+
+    try:
+        result = await op.perform(dry, wet)
+    except Exception as error:
+        if _log.isEnabledFor(logging.ERROR):
+            _log.error(
+                messages[2],
+                time.monotonic() - start,
+                error,
+                extra=extra,
+            )
+        # Re-wrap with op context (matches Rust/Java behavior). This is what
+        # wrap_nested_op_exception(name, ExecutionFailedError(detail))
+        # returns, built directly from the cached prefix without the
+        # intermediate error.
+        detail = repr(error) if isinstance(error, OpError) else str(error)
+        raise ExecutionFailedError(messages[3] + detail) from None
+
+    if _log.isEnabledFor(logging.INFO):
+        _log.info(messages[1], time.monotonic() - start, extra=extra)
+    return result
+
+
 def create_context_aware_logger(op: Op[T]) -> LoggingWrapper[T]:
     """Create a LoggingWrapper with caller location as the name."""
-    import inspect
-    frame = inspect.stack()[1]
-    filename = frame.filename.split("/")[-1].replace(".py", "")
-    lineno = frame.lineno
-    caller_name = f"{filename}::{lineno}"
+    frame = sys._getframe(1)
+    filename = file_stem(frame.f_code.co_filename)
+    caller_name = f"{filename}::{frame.f_lineno}"
     return LoggingWrapper.with_logger(op, caller_name, caller_name)
@@ -3,22 +3,42 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
+import copy
 import logging
+import sys
 import time
-from typing import Generic, Optional, TypeVar
+from typing import Any, Coroutine, Generic, Optional, TypeVar
 
+from ops._caller import file_stem
 from ops.op import Op
 from ops.op_metadata import OpMetadata
-from ops.contexts import DryContext, WetContext
-from ops.error import TimeoutError
+from ops.contexts import CancellationToken, DryContext, WetContext
+from ops.error import AbortedError, TimeoutError
 
 T = TypeVar("T")
 _log = logging.getLogger(__name__)
 
+_DEFAULT_TIMEBOUND_ABORT = "Time-bound operation aborted"
+
+# Python 3.12+ can start a task eagerly: it runs synchronously up to its
+# first suspension, so an op that never awaits is already done on return.
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def _start_task(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    if _EAGER_TASKS:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.ensure_future(coro)
+
 
 class TimeBoundWrapper(Op[T], Generic[T]):
-    """Wraps an op with a timeout. Returns TimeoutError if timeout elapses."""
+    """Wraps an op with a timeout. Returns TimeoutError if timeout elapses.
+
+    If the dry context is aborted while the op is pending, the op is
+    cancelled and AbortedError is raised without waiting for the timeout.
+    """
+
+    __slots__ = ("_wrapped_op", "_timeout_ms", "_trigger_name", "_warn_on_timeout")
 
     def __init__(
         self,
@@ -56,6 +76,8 @@ class TimeBoundWrapper(Op[T], Generic[T]):
             )
 
     def _log_near_timeout_completion(self, duration_s: float) -> None:
+        if not _log.isEnabledFor(logging.INFO):
+            return
         timeout_s = self._timeout_ms / 1000.0
         if timeout_s > 0 and (duration_s / timeout_s) > 0.8:
             _log.info(
@@ -67,24 +89,78 @@ class TimeBoundWrapper(Op[T], Generic[T]):
             )
 
     async def perform(self, dry: DryContext, wet: WetContext) -> T:
-        start = time.monotonic()
-        timeout_s = self._timeout_ms / 1000.0
+        # Elapsed time only feeds the INFO near-timeout record
+        timed = _log.isEnabledFor(logging.INFO)
+        start = time.monotonic() if timed else 0.0
+
+        inner = _start_task(self._wrapped_op.perform(dry, wet))
+        if inner.done():
+            # Finished without suspending; no timer or abort waiter needed
+            result = inner.result()
+        else:
+            result = await self._await_bounded(inner, dry._cancel, timed)
+
+        if timed:
+            self._log_near_timeout_completion(time.monotonic() - start)
+        return result
 
+    async def _await_bounded(
+        self, inner: "asyncio.Task[T]", cancel: CancellationToken, timed: bool
+    ) -> T:
+        """Wait for inner until it finishes, the timeout elapses or cancel fires.
+
+        One asyncio.wait covers both the timeout and an abort signalled
+        while the op is pending. A context already aborted on entry runs
+        the op as before, bounded by the timeout alone.
+        """
+        abort = None if cancel.aborted else asyncio.ensure_future(cancel.wait())
         try:
-            result = await asyncio.wait_for(
-                self._wrapped_op.perform(dry, wet), timeout=timeout_s
+            await asyncio.wait(
+                (inner,) if abort is None else (inner, abort),
+                timeout=self._timeout_ms / 1000.0,
+                return_when=asyncio.FIRST_COMPLETED,
             )
-        except asyncio.TimeoutError:
+        except BaseException:
+            # The caller was cancelled: let the op finish unwinding (e.g. a
+            # BatchOp rollback) before the cancellation propagates.
+            inner.cancel()
+            if abort is not None:
+                abort.cancel()
+            await asyncio.wait((inner,))
+            if not inner.cancelled():
+                inner.exception()  # retrieved, so it is not reported unhandled
+            raise
+        if abort is not None:
+            abort.cancel()
+
+        if not inner.done():
+            inner.cancel()
+            try:
+                await inner
+            except asyncio.CancelledError:
+                # The caller being cancelled meanwhile wins over the timeout.
+                # Task.cancelling() is 3.11+; 3.10 cannot tell the two apart.
+                current = asyncio.current_task()
+                if getattr(current, "cancelling", lambda: 0)():
+                    raise
+            if abort is not None and abort.done() and not abort.cancelled():
+                if timed:
+                    _log.info(
+                        "Op '%s' was cancelled because its context was aborted",
+                        self._get_trigger_name(),
+                    )
+                raise AbortedError(cancel.reason or _DEFAULT_TIMEBOUND_ABORT)
             self._log_timeout_warning()
             raise TimeoutError(self._timeout_ms)
 
-        duration_s = time.monotonic() - start
-        self._log_near_timeout_completion(duration_s)
-        return result
+        # The op finished first (possibly after aborting the context itself)
+        return inner.result()
 
     def metadata(self) -> OpMetadata:
         inner = self._wrapped_op.metadata()
         if self._trigger_name is not None:
+            # The inner op may hand out a cached instance; describe a copy.
+            inner = copy.copy(inner)
             inner.description = f"{self._trigger_name} (timeout: {self._timeout_ms}ms)"
         return inner
 
@@ -96,10 +172,9 @@ def create_timeout_wrapper_with_caller_name(
     op: Op[T], timeout_ms: int
 ) -> TimeBoundWrapper[T]:
     """Create TimeBoundWrapper using call-site location as name."""
-    frame = inspect.stack()[1]
-    filename = frame.filename.split("/")[-1].replace(".py", "")
-    lineno = frame.lineno
-    caller_name = f"{filename}::{lineno}"
+    frame = sys._getframe(1)
+    filename = file_stem(frame.f_code.co_filename)
+    caller_name = f"{filename}::{frame.f_lineno}"
     return TimeBoundWrapper.with_name(op, timeout_ms, caller_name)
 
 
@@ -2,40 +2,144 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Generic, TypeVar
+from itertools import islice
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
 
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - declared dependency
+    jsonschema = None
+
+from ops import _json
 from ops.op import Op
-from ops.op_metadata import OpMetadata
+from ops.op_metadata import OpMetadata, _CompiledSchema, _compile_schema
 from ops.contexts import DryContext, WetContext
 from ops.error import ContextError, OpError
 
 T = TypeVar("T")
 _log = logging.getLogger(__name__)
 
+# Schema errors listed in a ContextError; a huge invalid document would
+# otherwise produce (and hold) one error per offending node.
+_MAX_REPORTED_ERRORS = 10
+
+
+# Keywords that annotate a schema without constraining the instance
+_ANNOTATION_KEYWORDS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "examples"}
+)
+
+
+def _is_trivial_schema(schema: dict, value_is_object: bool) -> bool:
+    """True if schema accepts every value it will be given.
+
+    value_is_object says the validated value is always a dict (the dry
+    context), which a bare {"type": "object"} schema always accepts.
+    """
+    for keyword, constraint in schema.items():
+        if keyword in _ANNOTATION_KEYWORDS:
+            continue
+        if keyword == "type" and value_is_object and constraint == "object":
+            continue
+        if keyword in ("properties", "required") and not constraint:
+            continue
+        return False
+    return True
+
+
+# Per-type converters for objects the JSON encoder cannot handle itself
+_OUTPUT_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    names: List[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(
+            name for name in slots if name not in ("__dict__", "__weakref__")
+        )
+    return tuple(names)
+
+
+def _encoder_for(cls: type) -> Callable[[Any], Any]:
+    if any("__dict__" in klass.__dict__ for klass in cls.__mro__):
+        # Same result as the old default=vars
+        return vars
+    names = _slot_names(cls)
+    if names:
+        return lambda obj: {
+            name: getattr(obj, name) for name in names if hasattr(obj, name)
+        }
+    return vars  # raises TypeError, reported as a serialization failure
 
-def _run_json_schema_validation(value: object, schema: dict, label: str) -> None:
-    """Validate value against schema using jsonschema (JSON Schema Draft-7).
 
-    Raises ContextError on validation failure.
+def _output_default(obj: Any) -> Any:
+    """default= hook for output conversion: vars(), or slots for slotted types.
+
+    The converter is resolved once per type and cached.
     """
-    try:
-        import jsonschema
-        validator = jsonschema.Draft7Validator(schema)
-        errors = list(validator.iter_errors(value))
-        if errors:
-            messages = [f"{e.json_path}: {e.message}" for e in errors]
-            raise ContextError(f"{label}: {', '.join(messages)}")
-    except ImportError:
+    cls = type(obj)
+    encoder = _OUTPUT_ENCODERS.get(cls)
+    if encoder is None:
+        encoder = _OUTPUT_ENCODERS[cls] = _encoder_for(cls)
+    return encoder(obj)
+
+
+def _compile_validator(schema: dict) -> _CompiledSchema:
+    """Return the shared compiled form of schema.
+
+    Schemas are compiled once per schema object; the cache entry is shared
+    with OpMetadata's required-field checks (see op_metadata._compile_schema).
+    """
+    if jsonschema is None:
         raise RuntimeError(
             "jsonschema is required for ValidatingWrapper — "
             "install with: pip install jsonschema"
         )
+    return _compile_schema(schema).build_validators()
+
+
+def _raise_validation_error(
+    value: object, compiled: _CompiledSchema, label: str
+) -> None:
+    """Raise ContextError listing why value fails the compiled schema."""
+    # One more than reported, to tell whether the list was cut short
+    errors = list(
+        islice(compiled.validator.iter_errors(value), _MAX_REPORTED_ERRORS + 1)
+    )
+    message = ", ".join(
+        ["%s: %s" % (e.json_path, e.message) for e in errors[:_MAX_REPORTED_ERRORS]]
+    )
+    if len(errors) > _MAX_REPORTED_ERRORS:
+        message += ", ..."
+    raise ContextError(f"{label}: {message}")
 
 
 class ValidatingWrapper(Op[T], Generic[T]):
-    """Validates op inputs and outputs against JSON Schema."""
+    """Validates op inputs and outputs against JSON Schema.
+
+    The wrapped op's metadata is read once, at construction, and its schemas
+    compiled then; metadata() returns that same instance. An op whose
+    schemas change afterwards needs a new wrapper.
+    """
+
+    __slots__ = (
+        "_wrapped_op",
+        "_validate_input",
+        "_validate_output",
+        "_metadata",
+        "_op_name",
+        "_input_label",
+        "_output_label",
+        "_input_validator",
+        "_output_validator",
+        "_required_refs",
+        "_required_ref_set",
+        "_passthrough",
+    )
 
     def __init__(
         self,
@@ -47,6 +151,43 @@ class ValidatingWrapper(Op[T], Generic[T]):
         self._validate_input = validate_input
         self._validate_output = validate_output
 
+        metadata = op.metadata()
+        self._metadata = metadata
+        self._op_name = metadata.name
+        self._input_label = f"Input validation failed for {metadata.name}"
+        self._output_label = f"Output validation failed for {metadata.name}"
+        input_schema = metadata.input_schema
+        output_schema = metadata.output_schema
+        self._input_validator = (
+            _compile_validator(input_schema)
+            if validate_input
+            and input_schema is not None
+            and not _is_trivial_schema(input_schema, value_is_object=True)
+            else None
+        )
+        self._output_validator = (
+            _compile_validator(output_schema)
+            if validate_output
+            and output_schema is not None
+            and not _is_trivial_schema(output_schema, value_is_object=False)
+            else None
+        )
+        # References are ALWAYS validated when reference_schema is present —
+        # they are pre-conditions regardless of input/output validation mode.
+        if metadata.reference_schema is not None:
+            # Shared with OpMetadata.validate_wet_context for the same schema
+            compiled_refs = _compile_schema(metadata.reference_schema)
+            self._required_refs: Tuple[str, ...] = compiled_refs.required
+            self._required_ref_set = compiled_refs.required_set
+        else:
+            self._required_refs = ()
+            self._required_ref_set = frozenset()
+        self._passthrough = (
+            self._input_validator is None
+            and self._output_validator is None
+            and not self._required_refs
+        )
+
     @classmethod
     def new(cls, op: Op[T]) -> "ValidatingWrapper[T]":
         """Validate both input and output."""
@@ -60,63 +201,92 @@ class ValidatingWrapper(Op[T], Generic[T]):
     def output_only(cls, op: Op[T]) -> "ValidatingWrapper[T]":
         return cls(op, validate_input=False, validate_output=True)
 
-    def _validate_input_schema(self, dry: DryContext, metadata: OpMetadata) -> None:
-        if not self._validate_input:
-            return
-        if metadata.input_schema is None:
-            return
-        context_json = dict(dry.values())
-        _run_json_schema_validation(
-            context_json,
-            metadata.input_schema,
-            f"Input validation failed for {metadata.name}",
-        )
+    @classmethod
+    def maybe_wrap(
+        cls,
+        op: Op[T],
+        validate_input: bool = True,
+        validate_output: bool = True,
+    ) -> Op[T]:
+        """Wrap op only if the wrapper would check something.
 
-    def _validate_references_schema(
-        self, wet: WetContext, metadata: OpMetadata
-    ) -> None:
-        # References are ALWAYS validated when reference_schema is present —
-        # they are pre-conditions regardless of input/output validation mode.
-        if metadata.reference_schema is None:
-            return
-        required = metadata.reference_schema.get("required", [])
-        for ref_name in required:
-            if not wet.contains(ref_name):
-                raise ContextError(
-                    f"Required reference '{ref_name}' not found in WetContext "
-                    f"for op '{metadata.name}'"
+        Returns op itself when there is no non-trivial schema to validate in
+        the enabled directions and no required reference, saving the extra
+        await per call.
+        """
+        wrapper = cls(op, validate_input, validate_output)
+        return op if wrapper._passthrough else wrapper
+
+    def validate_only(self, dry: DryContext, wet: WetContext) -> None:
+        """Run the input and reference checks of perform without the op.
+
+        Raises ContextError exactly as perform would. Validation is
+        synchronous CPU work, so callers that want to vet several wrapped
+        ops up front (e.g. those fed only by external inputs) call this in a
+        plain loop; there is no I/O for asyncio.gather to overlap.
+        """
+        # accepts() is the fastjsonschema check when installed; is_valid
+        # stops at the first failure. Error details are only collected once
+        # a check fails. fastjsonschema treats tuples as arrays where Draft-7
+        # does not, so it only sees values that are plain JSON trees.
+        validator = self._input_validator
+        if validator is not None:
+            values = dry._values
+            if not (
+                (
+                    validator.fast is not None
+                    and _json._is_json_tree(values)
+                    and validator.accepts(values)
                 )
+                or validator.validator.is_valid(values)
+            ):
+                _raise_validation_error(values, validator, self._input_label)
 
-    def _validate_output_schema(self, output: T, metadata: OpMetadata) -> None:
-        if not self._validate_output:
-            return
-        if metadata.output_schema is None:
-            return
-        try:
-            output_json = json.loads(json.dumps(output, default=vars))
-        except (TypeError, ValueError) as e:
-            raise ContextError(
-                f"Failed to serialize output for validation: {e}"
-            )
-        _run_json_schema_validation(
-            output_json,
-            metadata.output_schema,
-            f"Output validation failed for {metadata.name}",
-        )
+        required = self._required_ref_set
+        if required:
+            references = wet._references
+            # One C-level containment check on the happy path; the loop only
+            # runs to name the first missing reference.
+            if not references.keys() >= required:
+                for ref_name in self._required_refs:
+                    if ref_name in references:
+                        continue
+                    raise ContextError(
+                        f"Required reference '{ref_name}' not found in WetContext "
+                        f"for op '{self._op_name}'"
+                    )
 
     async def perform(self, dry: DryContext, wet: WetContext) -> T:
-        metadata = self._wrapped_op.metadata()
+        # Nothing to validate: one flag test. maybe_wrap() avoids the
+        # wrapper (and its frame) altogether in that case.
+        if self._passthrough:
+            return await self._wrapped_op.perform(dry, wet)
 
-        self._validate_input_schema(dry, metadata)
-        self._validate_references_schema(wet, metadata)
+        # With nothing to validate up front this is two attribute tests
+        if self._input_validator is not None or self._required_ref_set:
+            self.validate_only(dry, wet)
 
         result = await self._wrapped_op.perform(dry, wet)
 
-        self._validate_output_schema(result, metadata)
+        validator = self._output_validator
+        if validator is not None:
+            try:
+                output_json = _json.to_jsonable(result, default=_output_default)
+            except (TypeError, ValueError) as e:
+                raise ContextError(
+                    f"Failed to serialize output for validation: {e}"
+                )
+            # to_jsonable returns a plain JSON tree, safe for accepts()
+            if not (
+                validator.accepts(output_json)
+                or validator.validator.is_valid(output_json)
+            ):
+                _raise_validation_error(output_json, validator, self._output_label)
         return result
 
     def metadata(self) -> OpMetadata:
-        return self._wrapped_op.metadata()
+        # The metadata the schemas above were compiled from
+        return self._metadata
 
     async def rollback(self, dry: DryContext, wet: WetContext) -> None:
         await self._wrapped_op.rollback(dry, wet)
@@ -0,0 +1,39 @@
+"""Shared pytest fixtures."""
+
+import sys
+
+import pytest
+import pytest_asyncio.plugin
+
+from ops.contexts import DryContext, WetContext
+
+try:
+    import uvloop
+except ImportError:  # optional dev dependency
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+    # Run async tests on uvloop's libuv-based loop when it is installed
+    if hasattr(pytest_asyncio.plugin, "PytestAsyncioSpecs"):
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"uvloop": uvloop.new_event_loop}
+
+    else:  # pytest-asyncio before the loop-factories hook
+
+        @pytest.fixture(scope="session")
+        def event_loop_policy():
+            return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+def dry() -> DryContext:
+    """A fresh, empty DryContext for each test."""
+    return DryContext()
+
+
+@pytest.fixture
+def wet() -> WetContext:
+    """A fresh, empty WetContext for each test."""
+    return WetContext()
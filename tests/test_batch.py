@@ -1,5 +1,7 @@
 """Tests for batch.py — mirrors Rust batch.rs tests TEST049-TEST056 and TEST093-TEST097."""
 
+import asyncio
+
 import pytest
 
 from ops.op import Op
@@ -23,6 +25,35 @@ class TestOp(Op):
         return OpMetadata.builder("TestOp").build()
 
 
+class IndependentOp(Op):
+    """Parallel-safe op with its own output; rollback records start/end in events."""
+
+    def __init__(self, name: str, output: str, events: list, parallel: bool = True):
+        self.name = name
+        self.output = output
+        self.events = events
+        self.parallel = parallel
+
+    async def perform(self, dry: DryContext, wet: WetContext) -> str:
+        return self.name
+
+    async def rollback(self, dry: DryContext, wet: WetContext) -> None:
+        self.events.append(f"start {self.name}")
+        await asyncio.sleep(0)
+        self.events.append(f"end {self.name}")
+
+    def metadata(self) -> OpMetadata:
+        return (
+            OpMetadata.builder(self.name)
+            .output_schema({
+                "type": "object",
+                "properties": {self.output: {"type": "string"}},
+            })
+            .rollback_parallel_safe(self.parallel)
+            .build()
+        )
+
+
 # TEST049: Run BatchOp with two succeeding ops and verify results contain both values in order
 async def test_049_batch_op_success():
     ops = [TestOp(1), TestOp(2)]
@@ -366,3 +397,130 @@ async def test_097_nested_batch_rollback():
 
     with pytest.raises(BatchFailedError):
         await outer_batch.perform(dry, wet)
+
+
+# TEST116: Verify BatchOp caches its metadata and rebuilds it after add_op
+def test_116_batch_metadata_cached_until_ops_change():
+    batch = BatchOp([TestOp(1)])
+    first = batch.metadata()
+    assert batch.metadata() is first
+    assert first.output_schema["maxItems"] == 1
+
+    batch.add_op(TestOp(2))
+    rebuilt = batch.metadata()
+    assert rebuilt is not first
+    assert rebuilt.output_schema["maxItems"] == 2
+
+
+# TEST118: Roll back independent parallel-safe ops concurrently while dependent ops stay LIFO
+async def test_118_batch_parallel_safe_rollback_waves():
+    events = []
+
+    ops = [
+        IndependentOp("serial", "s", events, parallel=False),
+        IndependentOp("a", "x", events),
+        IndependentOp("b", "y", events),
+        TestOp(0, should_fail=True),
+    ]
+    batch = BatchOp(ops)
+
+    with pytest.raises(BatchFailedError):
+        await batch.perform(DryContext(), WetContext())
+
+    # a and b overlap; the serial op only starts once both have finished
+    assert events[:2] == ["start b", "start a"]
+    assert set(events[2:4]) == {"end a", "end b"}
+    assert events[4:] == ["start serial", "end serial"]
+
+
+# TEST131: Perform equal pure ops once per stretch without an impure op in between
+async def test_131_batch_reuses_pure_op_results():
+    calls = []
+
+    class ReadOp(Op):
+        pure = True
+
+        def __init__(self, key: str):
+            self.key = key
+
+        def __eq__(self, other):
+            return type(other) is ReadOp and other.key == self.key
+
+        def __hash__(self):
+            return hash(self.key)
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            calls.append(self.key)
+            return dry.get(self.key)
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("ReadOp").build()
+
+    class WriteOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            dry.insert("a", 2)
+            return 0
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("WriteOp").build()
+
+    ops = [ReadOp("a"), ReadOp("a"), ReadOp("b"), WriteOp(), ReadOp("a")]
+    dry = DryContext().with_value("a", 1).with_value("b", 5)
+    results = await BatchOp(ops).perform(dry, WetContext())
+
+    assert results == [1, 1, 5, 0, 2]
+    assert calls == ["a", "b", "a"]
+
+
+# TEST139: Perform pure ops that define __eq__ without __hash__ every time instead of failing the batch
+async def test_139_batch_unhashable_pure_op():
+    calls = []
+
+    class UnhashableReadOp(Op):
+        pure = True
+
+        def __eq__(self, other):
+            return type(other) is UnhashableReadOp
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            calls.append(1)
+            return dry.get("a")
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("UnhashableReadOp").build()
+
+    ops = [UnhashableReadOp(), UnhashableReadOp()]
+    results = await BatchOp(ops).perform(DryContext().with_value("a", 1), WetContext())
+
+    assert results == [1, 1]
+    assert len(calls) == 2
+
+
+# TEST148: Roll back a pure op whose result was reused only once when a later op fails
+async def test_148_batch_reused_pure_op_rolled_back_once():
+    log = []
+
+    class PureOp(Op):
+        pure = True
+
+        def __eq__(self, other):
+            return type(other) is PureOp
+
+        def __hash__(self):
+            return hash(PureOp)
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            log.append("perform")
+            return 1
+
+        async def rollback(self, dry: DryContext, wet: WetContext) -> None:
+            log.append("rollback")
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("PureOp").build()
+
+    ops = [PureOp(), PureOp(), TestOp(0, should_fail=True)]
+    with pytest.raises(BatchFailedError):
+        await BatchOp(ops).perform(DryContext(), WetContext())
+
+    assert log == ["perform", "rollback"]
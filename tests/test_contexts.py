@@ -1,6 +1,7 @@
 """Tests for contexts.py — mirrors Rust contexts.rs tests TEST009-TEST020, TEST098-TEST103."""
 
 import json
+import math
 import copy
 import pytest
 
@@ -303,3 +304,122 @@ def test_103_wet_context_keys():
     ctx.insert_ref("svc2", Svc())
     keys = sorted(ctx.keys())
     assert keys == ["svc1", "svc2"]
+
+
+# TEST119: Verify clones share values copy-on-write and stay independent in both directions
+def test_119_dry_context_clone_copy_on_write():
+    original = DryContext().with_value("x", 1).with_value("y", 2)
+    cloned = original.clone()
+
+    original.insert("x", 10)
+    cloned.insert("z", 3)
+    assert cloned.get("x") == 1
+    assert not original.contains("z")
+
+    merged = cloned.clone()
+    merged.merge(DryContext().with_value("y", 20))
+    assert cloned.get("y") == 2
+    assert merged.get("y") == 20
+    assert sorted(merged.keys()) == ["x", "y", "z"]
+
+
+# TEST120: Verify DryContext.values() is a read-only live view
+def test_120_dry_context_values_is_read_only_view():
+    ctx = DryContext().with_value("a", 1)
+    view = ctx.values()
+    with pytest.raises(TypeError):
+        view["b"] = 2
+    ctx.insert("b", 2)
+    assert dict(view) == {"a": 1, "b": 2}
+
+    # Stays live across copy-on-write clones
+    clone = ctx.clone()
+    ctx.insert("c", 3)
+    clone.insert("d", 4)
+    assert dict(view) == {"a": 1, "b": 2, "c": 3}
+    assert clone.get("c") is None
+
+    shared = ctx.clone()
+    view = shared.values()
+    shared.insert("e", 5)
+    assert view["e"] == 5
+    assert not ctx.contains("e")
+
+
+# TEST127: Abort state lives on one cancellation token per context; clones get their own
+def test_127_cancellation_token_identity():
+    ctx = DryContext()
+    token = ctx.cancellation_token()
+
+    ctx.set_abort("stop")
+    assert token.aborted
+    assert token.reason == "stop"
+
+    clone = ctx.clone()
+    assert clone.cancellation_token() is not token
+    assert clone.is_aborted()
+    assert clone.abort_reason() == "stop"
+
+    ctx.clear_control_flags()
+    assert ctx.cancellation_token() is token
+    assert not token.aborted
+    assert clone.is_aborted()
+
+    restored = DryContext.from_json(clone.to_json())
+    assert restored.is_aborted()
+    assert restored.abort_reason() == "stop"
+
+
+# TEST129: Build a DryContext from a mapping and verify it holds an independent copy
+def test_129_dry_context_from_mapping():
+    source = {"a": 1, "b": [1, 2]}
+    ctx = DryContext.from_mapping(source)
+
+    assert ctx.get("a") == 1
+    assert ctx.get("b") == [1, 2]
+    assert not ctx.is_aborted()
+
+    ctx.insert("c", 3)
+    source["d"] = 4
+    assert "c" not in source
+    assert not ctx.contains("d")
+
+
+# TEST135: Read with get_or and verify the default is returned only for missing keys
+def test_135_dry_context_get_or():
+    ctx = DryContext()
+    ctx.insert("count", 0)
+    ctx.insert("nothing", None)
+
+    assert ctx.get_or("count", 5) == 0
+    assert ctx.get_or("nothing", 5) is None
+    assert ctx.get_or("missing", 5) == 5
+
+
+# TEST137: Bulk-insert with insert_many/insert_refs and verify a clone is not affected
+def test_137_bulk_insert():
+    ctx = DryContext().with_value("a", 1)
+    clone = ctx.clone()
+    ctx.insert_many({"a": 10, "b": 2})
+
+    assert ctx.get("a") == 10
+    assert ctx.get("b") == 2
+    assert clone.get("a") == 1
+    assert not clone.contains("b")
+
+    wet = WetContext()
+    wet.insert_refs({"database": object(), "cache": "redis"})
+    assert wet.contains("database")
+    assert wet.get_ref("cache") == "redis"
+
+
+# TEST142: Round-trip non-finite floats through to_json/from_json and read JSON holding NaN tokens
+def test_142_dry_context_json_non_finite_floats():
+    ctx = DryContext().with_value("nan", float("nan")).with_value("inf", float("inf"))
+    restored = DryContext.from_json(ctx.to_json())
+
+    assert math.isnan(restored.get("nan"))
+    assert restored.get("inf") == float("inf")
+
+    restored = DryContext.from_json(json.dumps({"values": {"x": float("-inf")}}))
+    assert restored.get("x") == float("-inf")
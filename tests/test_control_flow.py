@@ -5,6 +5,8 @@ Python equivalents work the same way using DryContext.set_abort() and the
 __continue_loop_{id} / __current_loop_id convention used by LoopOp.
 """
 
+import asyncio
+
 import pytest
 
 from ops.op import Op
@@ -13,6 +15,7 @@ from ops.contexts import DryContext, WetContext
 from ops.error import AbortedError, OpError
 from ops.batch import BatchOp
 from ops.loop_op import LoopOp
+from ops.wrappers.timeout_wrapper import TimeBoundWrapper
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +26,8 @@ from ops.loop_op import LoopOp
 class _AbortTestOp(Op):
     """Op that either aborts with optional reason or returns 42."""
 
+    _META = OpMetadata.builder("AbortTestOp").build()
+
     def __init__(self, should_abort: bool, abort_reason=None):
         self._should_abort = should_abort
         self._abort_reason = abort_reason
@@ -39,32 +44,40 @@ class _AbortTestOp(Op):
         return 42
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("AbortTestOp").build()
+        return self._META
 
 
 class _ContinueTestOp(Op):
     """Op that either signals loop-continue (returning 0) or returns value."""
 
+    _META = OpMetadata.builder("ContinueTestOp").build()
+
     def __init__(self, should_continue: bool, value: int):
         self._should_continue = should_continue
         self._value = value
 
     async def perform(self, dry: DryContext, wet: WetContext):
         if self._should_continue:
-            # Mirror Rust continue_loop! macro: read __current_loop_id, set flag
-            loop_id = dry.get("__current_loop_id")
-            if loop_id is not None:
-                dry.insert(f"__continue_loop_{loop_id}", True)
+            loop = dry.current_loop()
+            if loop is not None:
+                loop.signal_continue()
+            else:
+                # Mirror Rust continue_loop! macro: read __current_loop_id, set flag
+                loop_id = dry.get("__current_loop_id")
+                if loop_id is not None:
+                    dry.insert(f"__continue_loop_{loop_id}", True)
             return 0  # Default::default() for i32 in Rust
         return self._value
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("ContinueTestOp").build()
+        return self._META
 
 
 class _CheckAbortOp(Op):
     """Op that short-circuits with Aborted error if abort flag is already set."""
 
+    _META = OpMetadata.builder("CheckAbortOp").build()
+
     async def perform(self, dry: DryContext, wet: WetContext):
         if dry.is_aborted():
             reason = dry.abort_reason() or "Operation aborted"
@@ -72,7 +85,7 @@ class _CheckAbortOp(Op):
         return 100
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("CheckAbortOp").build()
+        return self._META
 
 
 # ---------------------------------------------------------------------------
@@ -81,11 +94,7 @@ class _CheckAbortOp(Op):
 
 
 # TEST057: Invoke the abort macro without a reason and verify the context is aborted with no reason string
-@pytest.mark.asyncio
-async def test_057_abort_macro_without_reason():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_057_abort_macro_without_reason(dry, wet):
     op = _AbortTestOp(should_abort=True, abort_reason=None)
     with pytest.raises(AbortedError) as exc_info:
         await op.perform(dry, wet)
@@ -97,11 +106,7 @@ async def test_057_abort_macro_without_reason():
 
 
 # TEST058: Invoke the abort macro with a reason string and verify abort_reason matches
-@pytest.mark.asyncio
-async def test_058_abort_macro_with_reason():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_058_abort_macro_with_reason(dry, wet):
     op = _AbortTestOp(should_abort=True, abort_reason="Test reason")
     with pytest.raises(AbortedError) as exc_info:
         await op.perform(dry, wet)
@@ -113,11 +118,7 @@ async def test_058_abort_macro_with_reason():
 
 
 # TEST059: Use the continue_loop macro inside an op and verify the scoped continue flag is set in context
-@pytest.mark.asyncio
-async def test_059_continue_loop_macro():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_059_continue_loop_macro(dry, wet):
     # Set up a loop context for the continue_loop logic to work
     loop_id = "test_loop_123"
     dry.insert("__current_loop_id", loop_id)
@@ -133,11 +134,7 @@ async def test_059_continue_loop_macro():
 
 
 # TEST060: Use check_abort macro to short-circuit when the abort flag is already set in context
-@pytest.mark.asyncio
-async def test_060_check_abort_macro():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_060_check_abort_macro(dry, wet):
     # First test without abort flag — should succeed
     op = _CheckAbortOp()
     result = await op.perform(dry, wet)
@@ -151,7 +148,6 @@ async def test_060_check_abort_macro():
 
 
 # TEST061: Run a BatchOp where the second op aborts and verify the batch stops and propagates the abort
-@pytest.mark.asyncio
 async def test_061_batch_op_with_abort():
     ops = [
         _AbortTestOp(should_abort=False),
@@ -169,7 +165,6 @@ async def test_061_batch_op_with_abort():
 
 
 # TEST062: Start a BatchOp with an abort flag already set and verify it immediately returns Aborted
-@pytest.mark.asyncio
 async def test_062_batch_op_with_pre_existing_abort():
     ops = [
         _AbortTestOp(should_abort=False),
@@ -189,7 +184,6 @@ async def test_062_batch_op_with_pre_existing_abort():
 
 
 # TEST063: Run a LoopOp where an op signals continue and verify subsequent ops in the iteration are skipped
-@pytest.mark.asyncio
 async def test_063_loop_op_with_continue():
     ops = [
         _ContinueTestOp(should_continue=False, value=10),   # Should execute, returns 10
@@ -209,7 +203,6 @@ async def test_063_loop_op_with_continue():
 
 
 # TEST064: Run a LoopOp where an op aborts mid-loop and verify the loop terminates with the abort error
-@pytest.mark.asyncio
 async def test_064_loop_op_with_abort():
     ops = [
         _AbortTestOp(should_abort=False),
@@ -227,7 +220,6 @@ async def test_064_loop_op_with_abort():
 
 
 # TEST065: Start a LoopOp with an abort flag already set and verify it immediately returns Aborted
-@pytest.mark.asyncio
 async def test_065_loop_op_with_pre_existing_abort():
     ops = [
         _AbortTestOp(should_abort=False),
@@ -246,7 +238,6 @@ async def test_065_loop_op_with_pre_existing_abort():
 
 
 # TEST066: Nest a batch with a continue op inside a loop and verify results across all iterations
-@pytest.mark.asyncio
 async def test_066_complex_control_flow_scenario():
     # Create a batch with one normal op and one that signals continue
     batch_ops = [
@@ -272,3 +263,31 @@ async def test_066_complex_control_flow_scenario():
     # Each result should be a list from the batch
     for batch_result in results:
         assert batch_result == [100, 0]
+
+
+# TEST133: Abort the outer context while a time-bound op inside a batch inside a loop is pending
+async def test_133_nested_ops_share_one_cancellation_token(dry, wet):
+    class _SleepOp(Op):
+        _META = OpMetadata.builder("SleepOp").build()
+
+        async def perform(self, dry: DryContext, wet: WetContext):
+            await asyncio.sleep(5)
+            return 1
+
+        def metadata(self) -> OpMetadata:
+            return self._META
+
+    batch = BatchOp([TimeBoundWrapper(_SleepOp(), timeout_ms=10_000)])
+    loop_op = LoopOp("nested_counter", 3, [batch])
+
+    async def abort_soon():
+        await asyncio.sleep(0.01)
+        dry.set_abort("Outer abort")
+
+    aborter = asyncio.ensure_future(abort_soon())
+    with pytest.raises(AbortedError) as exc_info:
+        await asyncio.wait_for(loop_op.perform(dry, wet), timeout=1)
+    await aborter
+
+    assert exc_info.value.reason == "Outer abort"
+    assert dry.cancellation_token().aborted
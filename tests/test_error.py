@@ -15,6 +15,7 @@ from ops.error import (
     TriggerError,
     OtherError,
     op_error_from_json_error,
+    parse_json_or_op_error,
 )
 
 
@@ -78,3 +79,15 @@ def test_111_op_error_from_json_error():
         op_err = op_error_from_json_error(json_err)
         assert isinstance(op_err, OtherError)
         assert isinstance(op_err, OpError)
+
+
+# TEST132: Parse JSON with parse_json_or_op_error and verify values pass through and failures become OtherError
+def test_132_parse_json_or_op_error():
+    value, err = parse_json_or_op_error('{"a": [1, 2]}')
+    assert value == {"a": [1, 2]}
+    assert err is None
+
+    value, err = parse_json_or_op_error("{invalid json")
+    assert value is None
+    assert isinstance(err, OtherError)
+    assert isinstance(err.wrapped, json.JSONDecodeError)
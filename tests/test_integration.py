@@ -23,30 +23,34 @@ from ops.ops import perform, get_caller_trigger_name, wrap_nested_op_exception
 class _FailingOp(Op):
     """Op that always fails with ExecutionFailed."""
 
+    _META = (
+        OpMetadata.builder("FailingOp")
+        .description("An op that always fails")
+        .build()
+    )
+
     async def perform(self, dry: DryContext, wet: WetContext) -> str:
         raise ExecutionFailedError("Simulated failure")
 
     def metadata(self) -> OpMetadata:
-        return (
-            OpMetadata.builder("FailingOp")
-            .description("An op that always fails")
-            .build()
-        )
+        return self._META
 
 
 class _SlowOp(Op):
     """Op that sleeps 200ms before returning."""
 
+    _META = (
+        OpMetadata.builder("SlowOp")
+        .description("An op that takes a long time")
+        .build()
+    )
+
     async def perform(self, dry: DryContext, wet: WetContext) -> str:
         await asyncio.sleep(0.2)
         return "should_timeout"
 
     def metadata(self) -> OpMetadata:
-        return (
-            OpMetadata.builder("SlowOp")
-            .description("An op that takes a long time")
-            .build()
-        )
+        return self._META
 
 
 class _ConfigService:
@@ -60,21 +64,29 @@ class _ConfigService:
 class _ConfigOp(Op):
     """Op that retrieves a config service from WetContext."""
 
+    _META = (
+        OpMetadata.builder("ConfigOp")
+        .description("Loads configuration from service")
+        .build()
+    )
+
     async def perform(self, dry: DryContext, wet: WetContext) -> dict:
         config_service = wet.get_required("config_service")
         return await config_service.get_config()
 
     def metadata(self) -> OpMetadata:
-        return (
-            OpMetadata.builder("ConfigOp")
-            .description("Loads configuration from service")
-            .build()
-        )
+        return self._META
 
 
 class _UserOp(Op):
     """Op that builds a user dict from DryContext fields."""
 
+    _META = (
+        OpMetadata.builder("UserOp")
+        .description("Creates a user from context data")
+        .build()
+    )
+
     async def perform(self, dry: DryContext, wet: WetContext) -> dict:
         user_id = dry.get_required("user_id")
         name = dry.get_required("name")
@@ -82,11 +94,7 @@ class _UserOp(Op):
         return {"id": user_id, "name": name, "email": email, "active": True}
 
     def metadata(self) -> OpMetadata:
-        return (
-            OpMetadata.builder("UserOp")
-            .description("Creates a user from context data")
-            .build()
-        )
+        return self._META
 
 
 # ---------------------------------------------------------------------------
@@ -95,11 +103,7 @@ class _UserOp(Op):
 
 
 # TEST083: Compose timeout and logging wrappers around a failing op and verify the error message includes the op name
-@pytest.mark.asyncio
-async def test_083_error_handling_and_wrapper_chains():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_083_error_handling_and_wrapper_chains(dry, wet):
     failing_op = _FailingOp()
     timeout_op = TimeBoundWrapper.with_name(failing_op, timeout_ms=50, name="FailingOp")
     logged_op = LoggingWrapper(timeout_op, trigger_name="TestFailure")
@@ -129,11 +133,7 @@ def test_085_exception_wrapping_utilities():
 
 
 # TEST086: Wrap a slow op in a short-timeout TimeBoundWrapper and verify the error is wrapped with logging context
-@pytest.mark.asyncio
-async def test_086_timeout_wrapper_functionality():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_086_timeout_wrapper_functionality(dry, wet):
     slow_op = _SlowOp()
     timeout_op = TimeBoundWrapper.with_name(slow_op, timeout_ms=50, name="SlowOp")
     logged_timeout_op = LoggingWrapper(timeout_op, trigger_name="TimeoutTest")
@@ -145,7 +145,6 @@ async def test_086_timeout_wrapper_functionality():
 
 
 # TEST087: Run an op that retrieves a service from WetContext and reads config values from it
-@pytest.mark.asyncio
 async def test_087_dry_and_wet_context_usage():
     dry = DryContext()
     dry.insert("service", "user_service")
@@ -163,13 +162,9 @@ async def test_087_dry_and_wet_context_usage():
 
 
 # TEST088: Run a BatchOp with two identical user-building ops and verify both produce the expected User struct
-@pytest.mark.asyncio
 async def test_088_batch_ops():
-    dry = (
-        DryContext()
-        .with_value("user_id", 1)
-        .with_value("name", "John Doe")
-        .with_value("email", "john@example.com")
+    dry = DryContext.from_mapping(
+        {"user_id": 1, "name": "John Doe", "email": "john@example.com"}
     )
     wet = WetContext()
 
@@ -185,17 +180,15 @@ async def test_088_batch_ops():
 
 
 # TEST089: Compose TimeBoundWrapper and LoggingWrapper around a simple op and verify the result passes through
-@pytest.mark.asyncio
-async def test_089_wrapper_composition():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_089_wrapper_composition(dry, wet):
     class _SimpleOp(Op):
+        _META = OpMetadata.builder("SimpleOp").build()
+
         async def perform(self, dry: DryContext, wet: WetContext) -> str:
             return "success"
 
         def metadata(self) -> OpMetadata:
-            return OpMetadata.builder("SimpleOp").build()
+            return self._META
 
     op = _SimpleOp()
     timeout_op = TimeBoundWrapper(op, timeout_ms=1000)
@@ -206,17 +199,15 @@ async def test_089_wrapper_composition():
 
 
 # TEST090: Use the perform() utility function directly and verify it returns the op result with auto-logging
-@pytest.mark.asyncio
-async def test_090_perform_utility():
-    dry = DryContext()
-    wet = WetContext()
-
+async def test_090_perform_utility(dry, wet):
     class _AutoLoggedOp(Op):
+        _META = OpMetadata.builder("AutoLoggedOp").build()
+
         async def perform(self, dry: DryContext, wet: WetContext) -> int:
             return 42
 
         def metadata(self) -> OpMetadata:
-            return OpMetadata.builder("AutoLoggedOp").build()
+            return self._META
 
     result = await perform(_AutoLoggedOp(), dry, wet)
     assert result == 42
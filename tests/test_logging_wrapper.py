@@ -17,42 +17,44 @@ from ops.wrappers.logging_wrapper import (
 
 
 class SuccessOp(Op):
+    _META = OpMetadata.builder("SuccessOp").build()
+
     async def perform(self, dry: DryContext, wet: WetContext) -> int:
         return 42
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("SuccessOp").build()
+        return self._META
 
 
 class FailingOp(Op):
+    _META = OpMetadata.builder("FailingOp").build()
+
     async def perform(self, dry: DryContext, wet: WetContext) -> int:
         raise ExecutionFailedError("test error")
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("FailingOp").build()
+        return self._META
 
 
 class StringOp(Op):
+    _META = OpMetadata.builder("StringOp").build()
+
     async def perform(self, dry: DryContext, wet: WetContext) -> str:
         return "test"
 
     def metadata(self) -> OpMetadata:
-        return OpMetadata.builder("StringOp").build()
+        return self._META
 
 
 # TEST029: Wrap a successful op in LoggingWrapper and verify it passes through the result unchanged
-async def test_029_logging_wrapper_success():
-    dry = DryContext()
-    wet = WetContext()
+async def test_029_logging_wrapper_success(dry, wet):
     wrapper = LoggingWrapper(SuccessOp(), "SuccessOp")
     result = await wrapper.perform(dry, wet)
     assert result == 42
 
 
 # TEST030: Wrap a failing op in LoggingWrapper and verify the error includes the op name context
-async def test_030_logging_wrapper_failure():
-    dry = DryContext()
-    wet = WetContext()
+async def test_030_logging_wrapper_failure(dry, wet):
     wrapper = LoggingWrapper(FailingOp(), "FailingOp")
 
     with pytest.raises(OpError) as exc_info:
@@ -63,9 +65,7 @@ async def test_030_logging_wrapper_failure():
 
 
 # TEST031: Use create_context_aware_logger helper and verify the wrapped op returns its result
-async def test_031_context_aware_logger():
-    dry = DryContext()
-    wet = WetContext()
+async def test_031_context_aware_logger(dry, wet):
     wrapper = create_context_aware_logger(StringOp())
     result = await wrapper.perform(dry, wet)
     assert result == "test"
@@ -1,12 +1,15 @@
 """Tests for loop_op.py — mirrors Rust loop_op.rs tests TEST067-TEST076, TEST113-TEST115."""
 
+import asyncio
+import os
+
 import pytest
 
-from ops.op import Op
+from ops.op import Op, static_metadata
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
 from ops.error import ExecutionFailedError, OpError
-from ops.loop_op import LoopOp
+from ops.loop_op import CURRENT_LOOP_ID_KEY, CURRENT_LOOP_REF, LoopFrame, LoopOp
 
 
 class TestOp(Op):
@@ -16,18 +19,57 @@ class TestOp(Op):
     async def perform(self, dry: DryContext, wet: WetContext) -> int:
         return self.value
 
+    @static_metadata
     def metadata(self) -> OpMetadata:
         return OpMetadata.builder("TestOp").build()
 
 
 class CounterOp(Op):
     async def perform(self, dry: DryContext, wet: WetContext) -> int:
-        return dry.get("loop_counter") or 0
+        return dry.get_or("loop_counter", 0)
 
+    @static_metadata
     def metadata(self) -> OpMetadata:
         return OpMetadata.builder("CounterOp").build()
 
 
+class IndependentOp(Op):
+    """Parallel-safe op with its own output; rollback records start/end in events."""
+
+    def __init__(self, name: str, output: str, events: list, parallel: bool = True):
+        self.name = name
+        self.output = output
+        self.events = events
+        self.parallel = parallel
+
+    async def perform(self, dry: DryContext, wet: WetContext) -> str:
+        return self.name
+
+    async def rollback(self, dry: DryContext, wet: WetContext) -> None:
+        self.events.append(f"start {self.name}")
+        await asyncio.sleep(0)
+        self.events.append(f"end {self.name}")
+
+    def metadata(self) -> OpMetadata:
+        return (
+            OpMetadata.builder(self.name)
+            .output_schema({
+                "type": "object",
+                "properties": {self.output: {"type": "string"}},
+            })
+            .rollback_parallel_safe(self.parallel)
+            .build()
+        )
+
+
+class FailingOp(Op):
+    async def perform(self, dry: DryContext, wet: WetContext) -> str:
+        raise ExecutionFailedError("boom")
+
+    def metadata(self) -> OpMetadata:
+        return OpMetadata.builder("FailingOp").build()
+
+
 # TEST067: Run a LoopOp for 3 iterations with 2 ops each and verify all 6 results in order
 async def test_067_loop_op_basic():
     ops = [TestOp(10), TestOp(20)]
@@ -166,14 +208,14 @@ async def test_074_loop_op_successful_iterations_not_rolled_back():
             self.fail_on_iteration = fail_on_iteration
 
         async def perform(self, dry: DryContext, wet: WetContext) -> int:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             performed_iters.append(counter)
             if self.fail_on_iteration is not None and counter == self.fail_on_iteration:
                 raise ExecutionFailedError(f"Failed on iteration {counter}")
             return 1
 
         async def rollback(self, dry: DryContext, wet: WetContext) -> None:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             rolled_back_iters.append(counter)
 
         def metadata(self) -> OpMetadata:
@@ -202,14 +244,14 @@ async def test_075_loop_op_mixed_iteration_with_rollback():
             self.fail_on_iteration = fail_on_iteration
 
         async def perform(self, dry: DryContext, wet: WetContext) -> int:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             performed_iters.append((self.op_id, counter))
             if self.fail_on_iteration is not None and counter == self.fail_on_iteration:
                 raise ExecutionFailedError(f"Op {self.op_id} failed on iteration {counter}")
             return self.op_id
 
         async def rollback(self, dry: DryContext, wet: WetContext) -> None:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             rolled_back_iters.append((self.op_id, counter))
 
         def metadata(self) -> OpMetadata:
@@ -241,14 +283,14 @@ async def test_076_loop_op_continue_on_error():
             self.fail_on_iteration = fail_on_iteration
 
         async def perform(self, dry: DryContext, wet: WetContext) -> int:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             performed_iters.append((self.op_id, counter))
             if self.fail_on_iteration is not None and counter == self.fail_on_iteration:
                 raise ExecutionFailedError(f"Op {self.op_id} failed on iteration {counter}")
             return self.op_id
 
         async def rollback(self, dry: DryContext, wet: WetContext) -> None:
-            counter = dry.get("test_counter") or 0
+            counter = dry.get_or("test_counter", 0)
             rolled_back_iters.append((self.op_id, counter))
 
         def metadata(self) -> OpMetadata:
@@ -309,7 +351,7 @@ async def test_114_loop_op_continue_on_error_skips_failed_iterations():
             self.fail_on = fail_on
 
         async def perform(self, dry: DryContext, wet: WetContext) -> int:
-            counter = dry.get("it_counter") or 0
+            counter = dry.get_or("it_counter", 0)
             iterations_seen.append(counter)
             if self.fail_on is not None and counter == self.fail_on:
                 raise ExecutionFailedError(f"fail on {counter}")
@@ -341,3 +383,165 @@ async def test_115_loop_op_with_no_ops_produces_no_results():
     assert results == []
     # Counter advances to limit
     assert dry.get("counter") == 5
+
+
+# TEST117: Signal continue and break through the loop reference published in WetContext
+async def test_117_loop_op_signals_via_wet_reference():
+    class SignalOp(Op):
+        def __init__(self, signal: str, value: int):
+            self.signal = signal
+            self.value = value
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            loop = wet.get_required(CURRENT_LOOP_REF, LoopFrame)
+            counter = dry.get("counter")
+            if self.signal == "continue" and counter == 0:
+                loop.signal_continue()
+            elif self.signal == "break" and counter == 1:
+                loop.signal_break()
+            return self.value
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("SignalOp").build()
+
+    ops = [SignalOp("continue", 1), SignalOp("break", 2), TestOp(3)]
+    loop = LoopOp("counter", 5, ops)
+    dry = DryContext()
+    wet = WetContext()
+
+    results = await loop.perform(dry, wet)
+    # Iteration 0 continues after the first op; iteration 1 breaks after the second
+    assert results == [1, 1, 2]
+    assert not any(key.startswith("__continue_loop_") for key in dry.keys())
+
+
+# TEST124: Roll back a failed iteration's parallel-safe, independent ops concurrently
+async def test_124_loop_parallel_safe_rollback_waves():
+    events = []
+
+    ops = [IndependentOp("a", "x", events), IndependentOp("b", "y", events), FailingOp()]
+    loop = LoopOp("loop_counter", 2, ops)
+
+    with pytest.raises(ExecutionFailedError):
+        await loop.perform(DryContext(), WetContext())
+
+    assert events[:2] == ["start b", "start a"]
+    assert set(events[2:]) == {"end a", "end b"}
+
+
+# TEST130: Expose the innermost running loop's frame via DryContext.current_loop and clear every loop view on exit
+async def test_130_current_loop_tracks_nesting():
+    seen = []
+
+    class RecordLoopOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            seen.append(dry.current_loop())
+            return 0
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("RecordLoopOp").build()
+
+    class ContinueOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            dry.current_loop().signal_continue()
+            return 1
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("ContinueOp").build()
+
+    inner = LoopOp("inner", 1, [RecordLoopOp(), ContinueOp(), TestOp(9)])
+    outer = LoopOp("outer", 1, [inner, RecordLoopOp()])
+    dry = DryContext()
+    wet = WetContext()
+
+    results = await outer.perform(dry, wet)
+    assert results == [[0, 1], 0]
+    assert [frame.loop for frame in seen] == [inner, outer]
+    assert dry.current_loop() is None
+    assert wet.get_ref(CURRENT_LOOP_REF) is None
+    assert dry.get(CURRENT_LOOP_ID_KEY) is None
+
+
+# TEST136: Run each iteration's ops concurrently with with_parallel_ops and verify result order and rollback on failure
+async def test_136_loop_op_parallel_ops():
+    events = []
+    rolled_back = []
+
+    class SleepOp(Op):
+        def __init__(self, name: str, delay: float):
+            self.name = name
+            self.delay = delay
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> str:
+            events.append(f"start {self.name}")
+            await asyncio.sleep(self.delay)
+            events.append(f"end {self.name}")
+            return self.name
+
+        async def rollback(self, dry: DryContext, wet: WetContext) -> None:
+            rolled_back.append(self.name)
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("SleepOp").build()
+
+    loop = LoopOp("loop_counter", 2, [SleepOp("a", 0.02), SleepOp("b", 0.01)])
+    results = await loop.with_parallel_ops(True).perform(DryContext(), WetContext())
+    assert results == ["a", "b", "a", "b"]
+    assert events[:4] == ["start a", "start b", "end b", "end a"]
+
+    loop = LoopOp("loop_counter", 2, [SleepOp("a", 0), FailingOp(), SleepOp("c", 0)])
+    with pytest.raises(ExecutionFailedError):
+        await loop.with_parallel_ops(True).perform(DryContext(), WetContext())
+    assert rolled_back == ["c", "a"]
+
+
+# TEST141: Perform one LoopOp concurrently on two contexts and verify each call keeps its own continue signal
+async def test_141_loop_op_concurrent_performs_keep_own_signals():
+    class ContinueOnceOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            frame = dry.current_loop()
+            await asyncio.sleep(0)
+            if dry.get("signal"):
+                frame.signal_continue()
+            await asyncio.sleep(0)
+            return 1
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("ContinueOnceOp").build()
+
+    class NameOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> str:
+            return dry.get("name")
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("NameOp").build()
+
+    loop = LoopOp("i", 1, [ContinueOnceOp(), NameOp()])
+    dry_a = DryContext().with_value("name", "A").with_value("signal", True)
+    dry_b = DryContext().with_value("name", "B")
+
+    results_a, results_b = await asyncio.gather(
+        loop.perform(dry_a, WetContext()), loop.perform(dry_b, WetContext())
+    )
+    assert results_a == [1]
+    assert results_b == [1, "B"]
+
+
+# TEST145: Give LoopOps created in a forked child ids distinct from the parent's
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_145_loop_ids_distinct_after_fork():
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, LoopOp("i", 1, [])._loop_id.encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    child_id = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert child_id
+    assert child_id != LoopOp("i", 1, [])._loop_id
+    assert not child_id.startswith(f"{os.getpid():x}-")
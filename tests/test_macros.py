@@ -109,7 +109,6 @@ class _MacroTestOp(Op):
         return OpMetadata.builder("MacroTestOp").description("Tests macro usage in ops").build()
 
 
-@pytest.mark.asyncio
 async def test_082_macros_in_op():
     # Prepare contexts
     dry = DryContext()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ops.op import Op
+from ops.op import Op, static_metadata
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
 from ops.error import OpError
@@ -100,3 +100,30 @@ async def test_004_op_custom_rollback():
     await op.rollback(dry, wet)
     assert state["performed"] is True
     assert state["rolled_back"] is True
+
+
+# TEST134: Decorate metadata with static_metadata and verify it is built once per class
+def test_134_static_metadata_built_once_per_class():
+    builds = []
+
+    class StaticOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            return 0
+
+        @static_metadata
+        def metadata(self) -> OpMetadata:
+            builds.append(type(self).__name__)
+            return OpMetadata.builder(type(self).__name__).build()
+
+    class DerivedOp(StaticOp):
+        pass
+
+    first = StaticOp().metadata()
+    assert StaticOp().metadata() is first
+    assert first.name == "StaticOp"
+
+    derived = DerivedOp().metadata()
+    assert derived is not first
+    assert derived.name == "DerivedOp"
+    assert DerivedOp().metadata() is derived
+    assert builds == ["StaticOp", "DerivedOp"]
@@ -2,6 +2,8 @@
 
 import pytest
 
+from ops.batch import BatchOp
+from ops.op import Op
 from ops.op_metadata import OpMetadata, TriggerFuse, ValidationReport
 from ops.contexts import DryContext, WetContext
 
@@ -158,3 +160,58 @@ def test_048_reference_schema_merging():
     assert len(required) == 2
     assert "service_a" in required
     assert "service_b" in required
+
+
+# TEST121: Metadata validation checks required fields only; property constraints are left to ValidatingWrapper
+def test_121_metadata_validates_required_fields_only():
+    metadata = (
+        OpMetadata.builder("TypedOp")
+        .input_schema({
+            "type": "object",
+            "properties": {"count": {"type": "integer", "minimum": 0}},
+            "required": ["count"],
+            "additionalProperties": False,
+        })
+        .build()
+    )
+
+    report = metadata.validate_dry_context(DryContext().with_value("count", 3))
+    assert report.is_valid
+
+    report = metadata.validate_dry_context(
+        DryContext().with_value("count", "three").with_value("extra", 1)
+    )
+    assert report.is_valid
+
+    report = metadata.validate_dry_context(DryContext())
+    assert [e.message for e in report.errors] == ["Required field 'count' is missing"]
+
+
+class _NeedsXOp(Op):
+    async def perform(self, dry: DryContext, wet: WetContext) -> int:
+        return dry.get_required("x")
+
+    def metadata(self) -> OpMetadata:
+        return (
+            OpMetadata.builder("NeedsXOp")
+            .input_schema({
+                "type": "object",
+                "properties": {"x": {"type": "integer"}},
+                "required": ["x"],
+            })
+            .build()
+        )
+
+
+# TEST138: Validate a context with extra keys against a BatchOp's metadata and through a TriggerFuse
+def test_138_batch_metadata_accepts_extra_context_keys():
+    metadata = BatchOp([_NeedsXOp(), _NeedsXOp()]).metadata()
+    assert metadata.input_schema["additionalProperties"] is False
+
+    dry = DryContext().with_value("x", 1).with_value("extra", 2)
+    assert metadata.validate_dry_context(dry).is_valid
+    assert not metadata.validate_dry_context(DryContext()).is_valid
+
+    fuse = TriggerFuse("batch").with_data("x", 1).with_data("extra", 2)
+    fuse.with_metadata(metadata)
+    assert fuse.validate_and_get_dry_context().get("extra") == 2
@@ -5,7 +5,7 @@ import pytest
 from ops.op import Op
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
-from ops.error import ExecutionFailedError
+from ops.error import ContextError, ExecutionFailedError
 from ops.ops import (
     perform,
     get_caller_trigger_name,
@@ -56,3 +56,15 @@ def test_008_wrap_runtime_exception():
     assert isinstance(wrapped, ExecutionFailedError)
     assert "Runtime error" in str(wrapped)
     assert "test error" in str(wrapped)
+
+
+# TEST122: Verify wrap_nested_op_exception dispatches an OpError subclass to its parent variant's wrapping
+def test_122_wrap_nested_op_exception_subclass():
+    class CustomContextError(ContextError):
+        pass
+
+    wrapped = wrap_nested_op_exception("TestOp", CustomContextError("missing key"))
+
+    assert type(wrapped) is ContextError
+    assert "TestOp" in str(wrapped)
+    assert "missing key" in str(wrapped)
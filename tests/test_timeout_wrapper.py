@@ -1,12 +1,16 @@
 """Tests for wrappers/timeout_wrapper.py — mirrors Rust timeout.rs tests TEST033-TEST037."""
 
 import asyncio
+import sys
+
 import pytest
 
 from ops.op import Op
 from ops.op_metadata import OpMetadata
 from ops.contexts import DryContext, WetContext
-from ops.error import TimeoutError
+from ops.batch import BatchOp
+from ops.error import AbortedError, TimeoutError
+from ops.loop_op import LoopOp
 from ops.wrappers.timeout_wrapper import (
     TimeBoundWrapper,
     create_timeout_wrapper_with_caller_name,
@@ -32,6 +36,53 @@ class VerySlowOp(Op):
         return OpMetadata.builder("VerySlowOp").build()
 
 
+class RollbackTrackingOp(Op):
+    def __init__(self, name: str, rolled_back: list):
+        self.name = name
+        self.rolled_back = rolled_back
+
+    async def perform(self, dry: DryContext, wet: WetContext) -> str:
+        return self.name
+
+    async def rollback(self, dry: DryContext, wet: WetContext) -> None:
+        self.rolled_back.append(self.name)
+
+    def metadata(self) -> OpMetadata:
+        return OpMetadata.builder("RollbackTrackingOp").build()
+
+
+class AbortThenSleepOp(Op):
+    async def perform(self, dry: DryContext, wet: WetContext) -> str:
+        # Suspend first so the abort lands while the wrapper is waiting
+        await asyncio.sleep(0)
+        dry.set_abort("stop")
+        await asyncio.sleep(0.01)
+        return "late"
+
+    def metadata(self) -> OpMetadata:
+        return OpMetadata.builder("AbortThenSleepOp").build()
+
+
+class SlowCleanupOp(Op):
+    """Sleeps until cancelled, then takes a while to clean up."""
+
+    def __init__(self, log: list, cleanup_s: float = 0.01):
+        self.log = log
+        self.cleanup_s = cleanup_s
+
+    async def perform(self, dry: DryContext, wet: WetContext) -> int:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            await asyncio.sleep(self.cleanup_s)
+            self.log.append("inner-cleanup")
+            raise
+        return 42
+
+    def metadata(self) -> OpMetadata:
+        return OpMetadata.builder("SlowCleanupOp").build()
+
+
 class StringOp(Op):
     async def perform(self, dry: DryContext, wet: WetContext) -> str:
         return "success"
@@ -102,3 +153,81 @@ async def test_037_logged_timeout_wrapper():
     wrapped = create_logged_timeout_wrapper(CompositeOp(), timeout_ms=100, trigger_name="CompositeOp")
     result = await wrapped.perform(dry, wet)
     assert result == "logged and timed"
+
+
+# TEST128: Abort the dry context while a time-bound op is pending and verify it is cancelled at once
+async def test_128_timeout_wrapper_cancelled_on_abort():
+    dry = DryContext()
+    wet = WetContext()
+    wrapper = TimeBoundWrapper(VerySlowOp(), timeout_ms=5000)
+
+    async def abort_soon() -> None:
+        await asyncio.sleep(0.01)
+        dry.set_abort("shutdown")
+
+    aborter = asyncio.ensure_future(abort_soon())
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(AbortedError) as exc_info:
+        await wrapper.perform(dry, wet)
+    await aborter
+
+    assert exc_info.value.reason == "shutdown"
+    assert loop.time() - start < 0.15
+
+
+# TEST140: Abort inside a BatchOp or LoopOp wrapped in TimeBoundWrapper and verify succeeded ops are rolled back
+async def test_140_timeout_wrapper_abort_rolls_back_inner_ops():
+    rolled_back = []
+    batch = BatchOp([
+        RollbackTrackingOp("a", rolled_back),
+        AbortThenSleepOp(),
+        RollbackTrackingOp("c", rolled_back),
+    ])
+    with pytest.raises(AbortedError):
+        await TimeBoundWrapper(batch, timeout_ms=5000).perform(
+            DryContext(), WetContext()
+        )
+    assert rolled_back == ["a"]
+
+    rolled_back.clear()
+    loop = LoopOp("i", 3, [RollbackTrackingOp("a", rolled_back), AbortThenSleepOp()])
+    with pytest.raises(AbortedError):
+        await TimeBoundWrapper(loop, timeout_ms=5000).perform(
+            DryContext(), WetContext()
+        )
+    assert rolled_back == ["a"]
+
+    rolled_back.clear()
+    loop.with_parallel_ops(True)
+    with pytest.raises(AbortedError):
+        await TimeBoundWrapper(loop, timeout_ms=5000).perform(
+            DryContext(), WetContext()
+        )
+    assert rolled_back == ["a"]
+
+
+# TEST146: Cancel the caller of a time-bound op and verify the op finishes cleaning up before the CancelledError arrives
+async def test_146_timeout_wrapper_outer_cancel_waits_for_inner():
+    log = []
+    wrapper = TimeBoundWrapper(SlowCleanupOp(log), timeout_ms=5000)
+    task = asyncio.ensure_future(wrapper.perform(DryContext(), WetContext()))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        log.append("outer-cancelled")
+    assert log == ["inner-cleanup", "outer-cancelled"]
+
+
+# TEST147: Cancel the caller while a timed-out op is still unwinding and verify CancelledError wins over TimeoutError
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="needs Task.cancelling()")
+async def test_147_timeout_wrapper_cancel_during_timeout_cleanup():
+    log = []
+    wrapper = TimeBoundWrapper(SlowCleanupOp(log, cleanup_s=0.05), timeout_ms=10)
+    task = asyncio.ensure_future(wrapper.perform(DryContext(), WetContext()))
+    await asyncio.sleep(0.03)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
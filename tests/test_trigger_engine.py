@@ -0,0 +1,60 @@
+"""Tests for trigger/engine.py."""
+import asyncio
+import pytest
+
+from ops.op import Op
+from ops.op_metadata import OpMetadata
+from ops.contexts import DryContext, WetContext
+from ops.error import ExecutionFailedError
+from ops.trigger import Trigger, TriggerEngine
+
+
+class PredicateTrigger(Trigger):
+    def __init__(self, name: str, predicate: Op):
+        self._name = name
+        self._predicate = predicate
+
+    def name(self) -> str:
+        return self._name
+
+    def predicate(self) -> Op:
+        return self._predicate
+
+    def actions(self) -> list:
+        return []
+
+
+# TEST149: Fail one predicate of a concurrent tick and verify the still pending predicate is cancelled before the error arrives
+async def test_149_concurrent_tick_cancels_pending_predicates():
+    log = []
+
+    class FailingPredicate(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> bool:
+            await asyncio.sleep(0)
+            raise ExecutionFailedError("predicate failed")
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("FailingPredicate").build()
+
+    class SlowPredicate(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> bool:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                log.append("cancelled")
+                raise
+            log.append("finished")
+            return True
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("SlowPredicate").build()
+
+    engine = TriggerEngine()
+    registry = engine.primary_registry()
+    registry.set(lambda: PredicateTrigger("failing", FailingPredicate()))
+    registry.set(lambda: PredicateTrigger("slow", SlowPredicate()))
+
+    with pytest.raises(ExecutionFailedError):
+        await engine.tick(DryContext(), WetContext(), concurrent=True)
+
+    assert log == ["cancelled"]
@@ -1,5 +1,8 @@
 """Tests for wrappers/validating_wrapper.py — mirrors Rust validating.rs tests TEST038-TEST046, TEST112."""
 
+import datetime
+import inspect
+
 import pytest
 
 from ops.op import Op
@@ -44,6 +47,27 @@ class ValidatedOp(Op):
         )
 
 
+class ReturnValueOp(Op):
+    """Returns a fixed value; the output schema requires a numeric "value"."""
+
+    def __init__(self, value):
+        self.value = value
+
+    async def perform(self, dry: DryContext, wet: WetContext):
+        return self.value
+
+    def metadata(self) -> OpMetadata:
+        return (
+            OpMetadata.builder("ReturnValueOp")
+            .output_schema({
+                "type": "object",
+                "properties": {"value": {"type": "number"}},
+                "required": ["value"],
+            })
+            .build()
+        )
+
+
 # TEST038: Run ValidatingWrapper with a valid input and verify the op executes and returns the result
 async def test_038_valid_input_output():
     validator = ValidatingWrapper.new(ValidatedOp())
@@ -240,3 +264,112 @@ async def test_112_output_only_still_validates_references():
     wet.insert_ref("database", "postgres://localhost")
     result = await validator.perform(dry, wet)
     assert result == 42
+
+
+# TEST123: Verify ValidatingWrapper reads the inner op's metadata once at construction, not on every perform
+async def test_123_metadata_read_once():
+    class CountingOp(ValidatedOp):
+        metadata_calls = 0
+
+        def metadata(self) -> OpMetadata:
+            CountingOp.metadata_calls += 1
+            return super().metadata()
+
+    validator = ValidatingWrapper.new(CountingOp())
+    assert CountingOp.metadata_calls == 1
+
+    dry = DryContext()
+    dry.insert("value", 7)
+    wet = WetContext()
+    for _ in range(3):
+        result = await validator.perform(dry, wet)
+        assert result.value == 7
+    assert CountingOp.metadata_calls == 1
+
+
+# TEST125: Verify ValidatingWrapper.maybe_wrap returns the op itself when there is nothing to validate
+async def test_125_maybe_wrap_elides_noop_wrapper():
+    class NoSchemaOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            return 1
+
+        def metadata(self) -> OpMetadata:
+            return OpMetadata.builder("NoSchemaOp").build()
+
+    op = NoSchemaOp()
+    assert ValidatingWrapper.maybe_wrap(op) is op
+
+    # Schemas exist, but both directions are disabled
+    validated = ValidatedOp()
+    assert (
+        ValidatingWrapper.maybe_wrap(
+            validated, validate_input=False, validate_output=False
+        )
+        is validated
+    )
+
+    wrapped = ValidatingWrapper.maybe_wrap(validated)
+    assert isinstance(wrapped, ValidatingWrapper)
+
+    # A wrapper built directly still passes through, and stays a coroutine op
+    passthrough = ValidatingWrapper(op)
+    assert inspect.iscoroutinefunction(passthrough.perform)
+    assert inspect.iscoroutinefunction(passthrough.rollback)
+    assert await passthrough.perform(DryContext(), WetContext()) == 1
+
+
+# TEST126: Verify ValidatingWrapper.validate_only checks inputs and references without running the op
+async def test_126_validate_only_does_not_perform():
+    class RecordingOp(ValidatedOp):
+        performed = False
+
+        async def perform(self, dry: DryContext, wet: WetContext) -> TestOutput:
+            RecordingOp.performed = True
+            return await super().perform(dry, wet)
+
+    validator = ValidatingWrapper.new(RecordingOp())
+    wet = WetContext()
+
+    with pytest.raises(ContextError) as exc_info:
+        validator.validate_only(DryContext(), wet)
+    assert "Input validation failed" in str(exc_info.value)
+
+    dry = DryContext()
+    dry.insert("value", 5)
+    validator.validate_only(dry, wet)
+    assert RecordingOp.performed is False
+
+
+# TEST143: Validate outputs the way stdlib json converts them: NaN stays a number, datetimes fail to serialize
+async def test_143_output_conversion_matches_stdlib():
+    result = await ValidatingWrapper.output_only(
+        ReturnValueOp(TestOutput(float("nan")))
+    ).perform(DryContext(), WetContext())
+    assert result.value != result.value
+
+    with pytest.raises(ContextError, match="Failed to serialize"):
+        await ValidatingWrapper.output_only(
+            ReturnValueOp({"value": 1, "at": datetime.datetime(2024, 1, 1)})
+        ).perform(DryContext(), WetContext())
+
+
+# TEST144: Reject a tuple where the input schema expects an array, as Draft-7 does, whichever validator runs
+async def test_144_tuple_input_is_not_an_array():
+    class ArrayInputOp(Op):
+        async def perform(self, dry: DryContext, wet: WetContext) -> int:
+            return 1
+
+        def metadata(self) -> OpMetadata:
+            return (
+                OpMetadata.builder("ArrayInputOp")
+                .input_schema({
+                    "type": "object",
+                    "properties": {"items": {"type": "array"}},
+                })
+                .build()
+            )
+
+    wrapper = ValidatingWrapper.input_only(ArrayInputOp())
+    assert await wrapper.perform(DryContext().with_value("items", [1, 2]), WetContext()) == 1
+    with pytest.raises(ContextError, match="Input validation failed"):
+        await wrapper.perform(DryContext().with_value("items", (1, 2)), WetContext())